@@ -1,218 +1,485 @@
 """The Uber Ride Tracker integration."""
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Final
 
-from homeassistant.config_entries import ConfigEntry
+import voluptuous as vol
+
+from homeassistant.components import persistent_notification
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import device_registry as dr
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
+    AUTH_TYPE_OAUTH,
+    AUTH_TYPE_PERSONAL_TOKEN,
     CONF_CLIENT_ID,
     CONF_CLIENT_SECRET,
     DOMAIN,
+    MANUFACTURER,
+    NAME,
+)
+from .api_client import UberAPIClient
+from .card_setup import (
+    CALLBACK_FILENAME,
+    CALLBACK_SOURCE,
+    CARD_FILENAME,
+    CARD_SOURCE,
+    _copy_public_file,
+    ensure_card_installed,
+    show_setup_instructions,
 )
-from .card_setup import ensure_card_installed, show_setup_instructions
+from .current_ride_coordinator import CURRENT_RIDE_SCAN_INTERVAL, UberCurrentRideCoordinator
+
+# Import platforms with the integration so forwarding doesn't import on the loop
+from . import binary_sensor, sensor  # noqa: F401
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.SENSOR, Platform.BINARY_SENSOR]
+PLATFORMS: Final = (Platform.SENSOR, Platform.BINARY_SENSOR)
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+GET_RIDE_HISTORY_SCHEMA = vol.Schema({
+    vol.Optional("entry_id"): cv.string,
+    vol.Optional("limit", default=5): vol.All(
+        vol.Coerce(int), vol.Range(min=0, max=50)
+    ),
+})
+
+# Notification message templates for the diagnostic services
+_OAUTH_REQUIRED_TMPL = (
+    "## 🔐 OAuth Authorization Required\n\n"
+    "**Auth URL:** {auth_url}\n\n"
+    "### Instructions:\n"
+    "1. Add this redirect URI to your Uber app:\n"
+    "   `https://home.erbarraud.com/local/uber_callback.html`\n\n"
+    "2. Visit the auth URL above\n"
+    "3. Authorize the app with your Uber account\n"
+    "4. You'll see a success page with your auth code\n"
+    "5. Copy the code (there's a copy button)\n"
+    "6. Use the `uber_ride_tracker.authorize` service with that code\n"
+)
+_API_TEST_HEADER_TMPL = (
+    "## API Test Results\n\n"
+    "**Token Valid:** {token_valid}\n"
+    "**Time:** {timestamp}\n\n"
+)
+_ENDPOINT_TMPL = (
+    "\n{status_emoji} **{description}**\n"
+    "   Endpoint: `{endpoint}`\n"
+    "   Status: {status}\n"
+)
+_RIDE_HISTORY_HEADER_TMPL = "## Ride History\n\n**Total Rides:** {count}\n\n"
+_RIDE_TMPL = (
+    "### Ride {i}\n"
+    "- Status: {status}\n"
+    "- Time: {start_time}\n"
+    "- Distance: {distance} miles\n"
+    "- Duration: {duration} mins\n"
+    "- Fare: ${total}\n\n"
+)
+_NO_RIDES_REQUESTED_MSG = "## Ride History\n\nNo rides requested."
+_RIDE_HISTORY_FAILED_TMPL = "## ❌ Failed to get ride history\n\nError: {error}\n"
+_ACTIVE_RIDE_TMPL = (
+    "## 🚗 Active Ride Found!\n\n"
+    "**Status:** {status}\n"
+    "**Driver:** {driver}\n"
+    "**Vehicle:** {make} {model}\n"
+    "**License:** {license_plate}\n"
+    "**ETA:** {eta} minutes\n"
+)
+_NO_ACTIVE_RIDE_MSG = "## No Active Ride\n\nNo ride is currently in progress."
+_RIDE_CHECK_FAILED_MSG = (
+    "## ❌ Failed to check ride\n\nCould not retrieve ride data from Uber API."
+)
+_AUTH_SUCCESS_TMPL = (
+    "## ✅ Authorization Successful!\n\n"
+    "**Token obtained:** Yes\n"
+    "**Expires in:** {expires_in} seconds\n"
+    "**Scope:** {scope}\n\n"
+    "You can now use the Uber Ride Tracker services!"
+)
+_AUTH_FAILED_TMPL = "## ❌ Authorization Failed\n\n**Error:** {error}\n"
+# Indexed by a bool: False -> "❌", True -> "✅"
+_STATUS_EMOJI = ("❌", "✅")
+_ERRORS_HEADER = "\n### ❌ Errors:\n"
+_ENDPOINT_ACCESS_HEADER = "### Endpoint Access:\n"
+
+
+@dataclass(slots=True)
+class UberRuntimeData:
+    """Runtime data for an Uber Ride Tracker config entry."""
+
+    api_client: UberAPIClient
+    coordinator: UberCurrentRideCoordinator
+    # Shared by every entity of the entry
+    device_info: DeviceInfo
+
 
+UberConfigEntry = ConfigEntry[UberRuntimeData]
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+
+async def _async_setup_card(hass: HomeAssistant) -> None:
+    """Install the card and show the matching setup instructions."""
+    card_setup_success = await ensure_card_installed(hass)
+    show_setup_instructions(hass, card_setup_success)
+
+
+def _log_connection_result(task: asyncio.Task) -> None:
+    """Log the outcome of the background connection test."""
+    if task.cancelled():
+        return
+    if (err := task.exception()) is not None:
+        _LOGGER.warning("Uber API connection test failed: %s", err)
+        return
+    connection_result = task.result()
+    if connection_result.get("success"):
+        _LOGGER.info("Uber API connection successful")
+    else:
+        _LOGGER.warning("Uber API connection failed: %s", connection_result.get("error"))
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Uber Ride Tracker integration."""
+    # Services are shared by all entries, so register them once
+    _async_register_services(hass)
+    return True
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: UberConfigEntry) -> bool:
     """Set up Uber Ride Tracker from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     
-    # Setup the card file and resources
-    card_setup_success = await ensure_card_installed(hass)
-    await show_setup_instructions(hass, card_setup_success)
+    # Setup the card file and resources once Home Assistant has started, so
+    # it stays off the startup path
+    entry.async_on_unload(async_at_started(hass, _async_setup_card))
     
-    # Create API client based on auth type
-    from .api_client import UberAPIClient
+    data = entry.data
+    auth_type = data.get("auth_type", AUTH_TYPE_OAUTH)
+    client_id = data.get(CONF_CLIENT_ID)
+    client_secret = data.get(CONF_CLIENT_SECRET)
     
-    if entry.data.get("auth_type") == "personal_token":
+    # Create API client based on auth type
+    if auth_type == AUTH_TYPE_PERSONAL_TOKEN:
         # Personal token mode - no client ID/secret needed
         api_client = UberAPIClient(
             hass,
             client_id=None,
-            client_secret=None
+            client_secret=None,
         )
-        api_client.access_token = entry.data["personal_access_token"]
-        _LOGGER.info("Using personal access token for user: %s", 
-                     entry.data.get("user_info", {}).get("email", "Unknown"))
+        api_client.access_token = data["personal_access_token"]
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Using personal access token for user: %s",
+                (data.get("user_info") or {}).get("email", "Unknown"),
+            )
     else:
         # OAuth mode
         api_client = UberAPIClient(
             hass,
-            entry.data.get(CONF_CLIENT_ID),
-            entry.data.get(CONF_CLIENT_SECRET)
+            client_id,
+            client_secret,
         )
         
         # Set tokens if they were stored during setup
-        if "access_token" in entry.data:
-            api_client.access_token = entry.data["access_token"]
+        if "access_token" in data:
+            api_client.access_token = data["access_token"]
             _LOGGER.info("Using stored access token from setup")
-        if "refresh_token" in entry.data:
-            api_client.refresh_token = entry.data["refresh_token"]
+        if "refresh_token" in data:
+            api_client.refresh_token = data["refresh_token"]
             _LOGGER.info("Using stored refresh token from setup")
     
-    # Test connection
-    connection_result = await api_client.test_connection()
-    if connection_result.get("success"):
-        _LOGGER.info("Uber API connection successful")
-    else:
-        _LOGGER.warning("Uber API connection failed: %s", connection_result.get("error"))
+    # Test connection in the background so it doesn't delay platform setup;
+    # tied to the entry so an unload cancels it
+    connection_task = entry.async_create_background_task(
+        hass, api_client.test_connection(), "uber_test_connection"
+    )
+    connection_task.add_done_callback(_log_connection_result)
     
-    # Store the configuration and API client
-    hass.data[DOMAIN][entry.entry_id] = {
-        "client_id": entry.data.get(CONF_CLIENT_ID),
-        "client_secret": entry.data.get(CONF_CLIENT_SECRET),
-        "auth_type": entry.data.get("auth_type", "oauth"),
-        "entry": entry,
-        "api_client": api_client,
-    }
+    # One coordinator per entry feeds every entity a single shared snapshot
+    scan_interval = CURRENT_RIDE_SCAN_INTERVAL
+    if update_interval := entry.options.get("update_interval"):
+        scan_interval = timedelta(seconds=update_interval)
+    coordinator = UberCurrentRideCoordinator(
+        hass, api_client, entry.entry_id, scan_interval
+    )
+    # Fetch the first snapshot in the background; entities start out showing
+    # no active ride, as they did before their first poll
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), "uber_first_refresh"
+    )
     
     # Register device
-    device_registry = dr.async_get(hass)
-    device_registry.async_get_or_create(
+    identifiers = {(DOMAIN, entry.entry_id)}
+    dr.async_get(hass).async_get_or_create(
         config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, entry.entry_id)},
-        manufacturer="Uber Technologies Inc.",
+        identifiers=identifiers,
+        manufacturer=MANUFACTURER,
         model="Ride Tracker",
-        name="Uber Ride Tracker",
+        name=NAME,
         sw_version="1.0.0",
     )
     
+    entry.runtime_data = UberRuntimeData(
+        api_client=api_client,
+        coordinator=coordinator,
+        device_info=DeviceInfo(
+            identifiers=identifiers,
+            name=NAME,
+            manufacturer=MANUFACTURER,
+            model="Ride Tracker",
+            sw_version="1.0.0",
+        ),
+    )
+    
     # Setup platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
-    # Register diagnostic services
-    async def handle_test_api_access(call: ServiceCall):
-        """Test what API endpoints are accessible."""
-        api_client = hass.data[DOMAIN][entry.entry_id].get("api_client")
-        if not api_client:
-            _LOGGER.error("No API client available")
-            return
+    # Reload when options such as the update interval change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    
+    _LOGGER.info(
+        "Uber Ride Tracker integration setup completed. "
+        "Note: OAuth authentication is required for API access. "
+        "Use service 'uber_ride_tracker.test_api_access' to test API."
+    )
+    
+    return True
+
+
+@callback
+def _async_get_api_client(hass: HomeAssistant, call: ServiceCall) -> UberAPIClient:
+    """Return the API client of the entry targeted by a service call."""
+    if entry_id := call.data.get("entry_id"):
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is None or entry.domain != DOMAIN:
+            raise ServiceValidationError(
+                f"{entry_id} is not an {NAME} config entry"
+            )
+    else:
+        # Default to the first loaded entry
+        entry = next(
+            (
+                entry
+                for entry in hass.config_entries.async_entries(DOMAIN)
+                if entry.state is ConfigEntryState.LOADED
+            ),
+            None,
+        )
+    if entry is None or entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"No loaded {NAME} config entry available")
+    return entry.runtime_data.api_client
+
+
+def _with_api_client(
+    hass: HomeAssistant,
+    handler: Callable[[ServiceCall, UberAPIClient], Awaitable[None]],
+) -> Callable[[ServiceCall], Awaitable[None]]:
+    """Resolve the targeted API client once and hand it to a service handler."""
+    async def _handle(call: ServiceCall) -> None:
+        await handler(call, _async_get_api_client(hass, call))
+    
+    return _handle
+
+
+def _sync_setup_callback(www_path: Path) -> str:
+    """Copy the callback page and card to www and describe the result."""
+    try:
+        # Create www directory if it doesn't exist
+        if not www_path.exists():
+            www_path.mkdir(mode=0o755, parents=True, exist_ok=True)
+            message = f"Created www directory at: {www_path}\n\n"
+        else:
+            message = f"www directory exists at: {www_path}\n\n"
         
-        result = await api_client.test_api_access()
-        _LOGGER.info("API Access Test Result: %s", result)
+        # Copy callback HTML
+        callback_source = CALLBACK_SOURCE
+        callback_dest = www_path / CALLBACK_FILENAME
         
-        # Format message for notification
-        if result.get('requires_oauth'):
-            message = "## 🔐 OAuth Authorization Required\n\n"
-            message += f"**Auth URL:** {result.get('auth_url')}\n\n"
-            message += "### Instructions:\n"
-            message += "1. Add this redirect URI to your Uber app:\n"
-            message += "   `https://home.erbarraud.com/local/uber_callback.html`\n\n"
-            message += "2. Visit the auth URL above\n"
-            message += "3. Authorize the app with your Uber account\n"
-            message += "4. You'll see a success page with your auth code\n"
-            message += "5. Copy the code (there's a copy button)\n"
-            message += "6. Use the `uber_ride_tracker.authorize` service with that code\n"
+        if callback_source.exists():
+            _copy_public_file(callback_source, callback_dest)
+            message += f"✅ Callback page copied to: {callback_dest}\n"
+            message += "Access it at: https://home.erbarraud.com/local/uber_callback.html\n\n"
         else:
-            message = f"## API Test Results\n\n"
-            message += f"**Token Valid:** {'✅' if result['token_valid'] else '❌'}\n"
-            message += f"**Time:** {result['timestamp']}\n\n"
+            message += f"❌ Source file not found at: {callback_source}\n\n"
         
-        if result.get('errors'):
-            message += "\n### ❌ Errors:\n"
-            for error in result['errors']:
-                message += f"- {error}\n"
-            message += "\n"
+        # Also copy the card file
+        card_source = CARD_SOURCE
+        card_dest = www_path / CARD_FILENAME
         
-        if result.get('accessible_endpoints'):
-            message += "### Endpoint Access:\n"
-            for endpoint in result['accessible_endpoints']:
-                status_emoji = "✅" if endpoint['accessible'] else "❌"
-                message += f"\n{status_emoji} **{endpoint['description']}**\n"
-                message += f"   Endpoint: `{endpoint['endpoint']}`\n"
-                message += f"   Status: {endpoint['status']}\n"
-                
-                if endpoint.get('sample_data'):
-                    message += f"   Data: {endpoint['sample_data']}\n"
-                if endpoint.get('error'):
-                    message += f"   Error: {endpoint['error']}\n"
+        if card_source.exists():
+            _copy_public_file(card_source, card_dest)
+            message += f"✅ Card file copied to: {card_dest}\n"
+        else:
+            message += f"⚠️ Card file not found at: {card_source}\n"
         
-        # Show notification
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "🔍 Uber API Diagnostic Results",
-                "message": message,
-                "notification_id": "uber_api_diagnostic",
-            },
+        # List www directory contents
+        message += f"\n**Contents of {www_path}:**\n"
+        for file in www_path.iterdir():
+            message += f"- {file.name} ({file.stat().st_size} bytes)\n"
+            
+    except Exception as e:
+        message = f"❌ Error: {e}"
+    
+    return message
+
+
+@callback
+def _async_notify_api_access(hass: HomeAssistant, result: dict[str, Any]) -> None:
+    """Show the API access test results in a notification."""
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("API Access Test Result: %s", result)
+    
+    # Format message for notification
+    parts: list[str] = []
+    if result.get('requires_oauth'):
+        parts.append(_OAUTH_REQUIRED_TMPL.format(auth_url=result.get('auth_url')))
+    else:
+        parts.append(_API_TEST_HEADER_TMPL.format(
+            token_valid=_STATUS_EMOJI[bool(result['token_valid'])],
+            timestamp=result['timestamp'],
+        ))
+    
+    if result.get('errors'):
+        parts.append(_ERRORS_HEADER)
+        parts.extend(f"- {error}\n" for error in result['errors'])
+        parts.append("\n")
+    
+    if result.get('accessible_endpoints'):
+        parts.append(_ENDPOINT_ACCESS_HEADER)
+        for endpoint in result['accessible_endpoints']:
+            parts.append(_ENDPOINT_TMPL.format(
+                status_emoji=_STATUS_EMOJI[bool(endpoint['accessible'])],
+                description=endpoint['description'],
+                endpoint=endpoint['endpoint'],
+                status=endpoint.get('status'),
+            ))
+    
+            if endpoint.get('sample_data'):
+                parts.append(f"   Data: {endpoint['sample_data']}\n")
+            if endpoint.get('error'):
+                parts.append(f"   Error: {endpoint['error']}\n")
+    
+    message = "".join(parts)
+    
+    # Show notification
+    persistent_notification.async_create(
+        hass,
+        message,
+        title="🔍 Uber API Diagnostic Results",
+        notification_id="uber_api_diagnostic",
+    )
+
+
+@callback
+def _async_notify_ride_history(
+    hass: HomeAssistant, result: dict[str, Any] | None
+) -> None:
+    """Show fetched ride history in a notification."""
+    if result and result.get("success"):
+        message = _RIDE_HISTORY_HEADER_TMPL.format(
+            count=result.get('count', 0)
+        ) + "".join(
+            _RIDE_TMPL.format(
+                i=i,
+                status=ride.get('status'),
+                start_time=ride.get('start_time'),
+                distance=ride.get('distance'),
+                duration=ride.get('duration'),
+                total=ride.get('total'),
+            )
+            for i, ride in enumerate(result.get('rides', []), 1)
+        )
+    else:
+        message = _RIDE_HISTORY_FAILED_TMPL.format(
+            error=result.get('error') if result else 'No response'
         )
+        if result and result.get('details'):
+            message += f"Details: {result['details']}\n"
     
-    async def handle_get_ride_history(call: ServiceCall):
+    persistent_notification.async_create(
+        hass,
+        message,
+        title="📜 Uber Ride History",
+        notification_id="uber_ride_history",
+    )
+
+
+@callback
+def _async_notify_current_ride(
+    hass: HomeAssistant, ride_data: dict[str, Any] | None
+) -> None:
+    """Show the current ride status in a notification."""
+    if ride_data:
+        if ride_data.get("has_ride"):
+            message = _ACTIVE_RIDE_TMPL.format(
+                status=ride_data.get('status'),
+                driver=ride_data.get('driver_name', 'Unknown'),
+                make=ride_data.get('vehicle_make', ''),
+                model=ride_data.get('vehicle_model', ''),
+                license_plate=ride_data.get('vehicle_license_plate', ''),
+                eta=ride_data.get('eta', '?'),
+            )
+        else:
+            message = _NO_ACTIVE_RIDE_MSG
+    else:
+        message = _RIDE_CHECK_FAILED_MSG
+    
+    persistent_notification.async_create(
+        hass,
+        message,
+        title="🔄 Current Ride Status",
+        notification_id="uber_current_ride",
+    )
+
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the diagnostic services."""
+    if hass.services.has_service(DOMAIN, "authorize"):
+        # Services are shared by every entry and only need registering once
+        return
+    
+    async def handle_test_api_access(call: ServiceCall, api_client: UberAPIClient):
+        """Test what API endpoints are accessible."""
+        _async_notify_api_access(hass, await api_client.test_api_access())
+    
+    async def handle_get_ride_history(call: ServiceCall, api_client: UberAPIClient):
         """Get ride history from Uber."""
-        api_client = hass.data[DOMAIN][entry.entry_id].get("api_client")
-        if not api_client:
-            _LOGGER.error("No API client available")
+        limit = call.data["limit"]
+        if limit == 0:
+            # Nothing to fetch; don't spend a round-trip on an empty page
+            persistent_notification.async_create(
+                hass,
+                _NO_RIDES_REQUESTED_MSG,
+                title="📜 Uber Ride History",
+                notification_id="uber_ride_history",
+            )
             return
-        
-        limit = call.data.get("limit", 5)
-        result = await api_client.get_ride_history(limit)
-        
-        if result and result.get("success"):
-            message = f"## Ride History\n\n"
-            message += f"**Total Rides:** {result.get('count', 0)}\n\n"
-            
-            for i, ride in enumerate(result.get('rides', []), 1):
-                message += f"### Ride {i}\n"
-                message += f"- Status: {ride.get('status')}\n"
-                message += f"- Time: {ride.get('start_time')}\n"
-                message += f"- Distance: {ride.get('distance')} miles\n"
-                message += f"- Duration: {ride.get('duration')} mins\n"
-                message += f"- Fare: ${ride.get('total')}\n\n"
-        else:
-            message = f"## ❌ Failed to get ride history\n\n"
-            message += f"Error: {result.get('error') if result else 'No response'}\n"
-            if result and result.get('details'):
-                message += f"Details: {result['details']}\n"
-        
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "📜 Uber Ride History",
-                "message": message,
-                "notification_id": "uber_ride_history",
-            },
-        )
+        _async_notify_ride_history(hass, await api_client.get_ride_history(limit))
     
-    async def handle_check_current_ride(call: ServiceCall):
+    async def handle_check_current_ride(call: ServiceCall, api_client: UberAPIClient):
         """Manually check for current ride."""
-        api_client = hass.data[DOMAIN][entry.entry_id].get("api_client")
-        if not api_client:
-            _LOGGER.error("No API client available")
-            return
-        
-        ride_data = await api_client.get_current_ride()
-        
-        if ride_data:
-            if ride_data.get("has_ride"):
-                message = f"## 🚗 Active Ride Found!\n\n"
-                message += f"**Status:** {ride_data.get('status')}\n"
-                message += f"**Driver:** {ride_data.get('driver_name', 'Unknown')}\n"
-                message += f"**Vehicle:** {ride_data.get('vehicle_make', '')} {ride_data.get('vehicle_model', '')}\n"
-                message += f"**License:** {ride_data.get('vehicle_license_plate', '')}\n"
-                message += f"**ETA:** {ride_data.get('eta', '?')} minutes\n"
-            else:
-                message = "## No Active Ride\n\nNo ride is currently in progress."
-        else:
-            message = "## ❌ Failed to check ride\n\nCould not retrieve ride data from Uber API."
-        
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "🔄 Current Ride Status",
-                "message": message,
-                "notification_id": "uber_current_ride",
-            },
-        )
+        _async_notify_current_ride(hass, await api_client.get_current_ride())
     
-    async def handle_authorize(call: ServiceCall):
+    async def handle_run_diagnostics(call: ServiceCall, api_client: UberAPIClient):
+        """Run all three diagnostics concurrently and report each of them."""
+        results = await api_client.run_diagnostics()
+        _async_notify_api_access(hass, results["access"])
+        _async_notify_ride_history(hass, results["history"])
+        _async_notify_current_ride(hass, results["current"])
+    
+    async def handle_authorize(call: ServiceCall, api_client: UberAPIClient):
         """Handle OAuth authorization with auth code."""
         auth_code = call.data.get("auth_code")
         redirect_uri = call.data.get("redirect_uri")
@@ -225,116 +492,71 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 return
             _LOGGER.info("Using stored auth code from callback")
         
-        api_client = hass.data[DOMAIN][entry.entry_id].get("api_client")
-        if not api_client:
-            _LOGGER.error("No API client available")
-            return
-        
         result = await api_client.exchange_auth_code(auth_code, redirect_uri)
         
         if result.get("success"):
-            message = "## ✅ Authorization Successful!\n\n"
-            message += f"**Token obtained:** Yes\n"
-            message += f"**Expires in:** {result.get('expires_in')} seconds\n"
-            message += f"**Scope:** {result.get('scope')}\n\n"
-            message += "You can now use the Uber Ride Tracker services!"
+            message = _AUTH_SUCCESS_TMPL.format(
+                expires_in=result.get('expires_in'), scope=result.get('scope')
+            )
         else:
-            message = "## ❌ Authorization Failed\n\n"
-            message += f"**Error:** {result.get('error')}\n"
+            message = _AUTH_FAILED_TMPL.format(error=result.get('error'))
             if result.get('details'):
                 message += f"**Details:** {result.get('details')}\n"
         
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "🔐 Uber OAuth Authorization",
-                "message": message,
-                "notification_id": "uber_auth_result",
-            },
+        persistent_notification.async_create(
+            hass,
+            message,
+            title="🔐 Uber OAuth Authorization",
+            notification_id="uber_auth_result",
         )
     
     # Register all services
     hass.services.async_register(
         DOMAIN,
         "authorize",
-        handle_authorize,
+        _with_api_client(hass, handle_authorize),
     )
     
     hass.services.async_register(
         DOMAIN,
         "test_api_access",
-        handle_test_api_access,
+        _with_api_client(hass, handle_test_api_access),
     )
     
     hass.services.async_register(
         DOMAIN,
-        "get_ride_history", 
-        handle_get_ride_history,
+        "get_ride_history",
+        _with_api_client(hass, handle_get_ride_history),
+        schema=GET_RIDE_HISTORY_SCHEMA,
     )
     
     hass.services.async_register(
         DOMAIN,
         "check_current_ride",
-        handle_check_current_ride,
+        _with_api_client(hass, handle_check_current_ride),
     )
     
+    hass.services.async_register(
+        DOMAIN,
+        "run_diagnostics",
+        _with_api_client(hass, handle_run_diagnostics),
+    )
+    
+    # The www path doesn't change while Home Assistant runs
+    www_path = Path(hass.config.path("www"))
+    
     async def handle_setup_callback(call: ServiceCall):
         """Manually copy callback file to www folder."""
-        from pathlib import Path
-        import shutil
-        
-        try:
-            # Get paths
-            www_path = Path(hass.config.path("www"))
-            integration_dir = Path(__file__).parent
-            
-            # Create www directory if it doesn't exist
-            if not www_path.exists():
-                www_path.mkdir(mode=0o755, parents=True, exist_ok=True)
-                message = f"Created www directory at: {www_path}\n\n"
-            else:
-                message = f"www directory exists at: {www_path}\n\n"
-            
-            # Copy callback HTML
-            callback_source = integration_dir / "www" / "uber_callback.html"
-            callback_dest = www_path / "uber_callback.html"
-            
-            if callback_source.exists():
-                shutil.copy2(str(callback_source), str(callback_dest))
-                callback_dest.chmod(0o644)
-                message += f"✅ Callback page copied to: {callback_dest}\n"
-                message += f"Access it at: https://home.erbarraud.com/local/uber_callback.html\n\n"
-            else:
-                message += f"❌ Source file not found at: {callback_source}\n\n"
-            
-            # Also copy the card file
-            card_source = integration_dir / "www" / "uber-ride-tracker-card.js"
-            card_dest = www_path / "uber-ride-tracker-card.js"
-            
-            if card_source.exists():
-                shutil.copy2(str(card_source), str(card_dest))
-                card_dest.chmod(0o644)
-                message += f"✅ Card file copied to: {card_dest}\n"
-            else:
-                message += f"⚠️ Card file not found at: {card_source}\n"
-            
-            # List www directory contents
-            message += f"\n**Contents of {www_path}:**\n"
-            for file in www_path.iterdir():
-                message += f"- {file.name} ({file.stat().st_size} bytes)\n"
-                
-        except Exception as e:
-            message = f"❌ Error: {e}"
+        # File copies and directory listing block, so run them in the executor
+        message = await hass.async_add_executor_job(
+            _sync_setup_callback, www_path
+        )
         
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "🔧 Uber OAuth Callback Setup",
-                "message": message,
-                "notification_id": "uber_callback_setup",
-            },
+        persistent_notification.async_create(
+            hass,
+            message,
+            title="🔧 Uber OAuth Callback Setup",
+            notification_id="uber_callback_setup",
         )
     
     hass.services.async_register(
@@ -342,23 +564,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "setup_callback",
         handle_setup_callback,
     )
-    
-    _LOGGER.info(
-        "Uber Ride Tracker integration setup completed. "
-        "Note: OAuth authentication is required for API access. "
-        "Use service 'uber_ride_tracker.test_api_access' to test API."
-    )
-    
-    return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: UberConfigEntry) -> bool:
     """Unload a config entry."""
-    # Unload platforms
+    # Unload platforms; runtime_data is released with the entry
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        # Remove data
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await entry.runtime_data.api_client.close()
     
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
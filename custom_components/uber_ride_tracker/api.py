@@ -7,17 +7,23 @@ Note: Uber's developer dashboard shows credentials as:
 These map directly to OAuth2 client_id and client_secret parameters.
 """
 import asyncio
+import functools
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional
 
 import aiohttp
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
+from .api_client import async_get_uber_session
 from .const import (
     API_BASE_URL,
     API_TIMEOUT,
+    DOMAIN,
     ENDPOINT_CURRENT_REQUEST,
     ENDPOINT_REQUEST_DETAILS,
     ENDPOINT_REQUEST_MAP,
@@ -29,12 +35,33 @@ from .const import (
     ERROR_NO_ACTIVE_RIDE,
     ERROR_RATE_LIMITED,
     RATE_LIMIT_CALLS,
+    RATE_LIMIT_MAX_WAIT,
     RATE_LIMIT_WINDOW,
 )
 from .oauth import UberOAuthManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared, read-only stand-in for missing sub-objects
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+RATE_LIMIT_REMAINING_HEADER: Final = "X-Rate-Limit-Remaining"
+RATE_LIMIT_RESET_HEADER: Final = "X-Rate-Limit-Reset"
+
+# Full URLs, resolved once at import
+URL_CURRENT_REQUEST: Final = API_BASE_URL + ENDPOINT_CURRENT_REQUEST
+URL_REQUEST_DETAILS: Final = API_BASE_URL + ENDPOINT_REQUEST_DETAILS
+URL_REQUEST_RECEIPT: Final = API_BASE_URL + ENDPOINT_REQUEST_RECEIPT
+URL_REQUEST_MAP: Final = API_BASE_URL + ENDPOINT_REQUEST_MAP
+URL_USER_PROFILE: Final = API_BASE_URL + ENDPOINT_USER_PROFILE
+URL_TRIP_HISTORY: Final = API_BASE_URL + ENDPOINT_TRIP_HISTORY
+
+
+@functools.lru_cache(maxsize=128)
+def _request_url(template: str, request_id: str) -> str:
+    """Return the URL for a per-ride endpoint."""
+    return template.format(request_id=request_id)
+
 
 class UberAPIError(Exception):
     """Base exception for Uber API errors."""
@@ -60,6 +87,58 @@ class UberNoActiveRideError(UberAPIError):
     pass
 
 
+def _not_found_error(url: str) -> UberAPIError:
+    """Build the error for a 404 from the given URL."""
+    if url == URL_CURRENT_REQUEST:
+        return UberNoActiveRideError("No active ride found")
+    return UberAPIError(f"Resource not found: {url}")
+
+
+# Error statuses with a dedicated exception; other 4xx/5xx carry the API message
+_STATUS_ERRORS: Final[Dict[int, Callable[[str], UberAPIError]]] = {
+    401: lambda url: UberAuthenticationError("Authentication failed"),
+    404: _not_found_error,
+    429: lambda url: UberRateLimitError("Rate limited"),
+}
+
+
+@dataclass(slots=True)
+class ParsedRide:
+    """A ride from the Uber API, flattened into plain attributes."""
+
+    request_id: Optional[str] = None
+    product_id: Optional[str] = None
+    status: Optional[str] = None
+    driver_name: Optional[str] = None
+    driver_phone_number: Optional[str] = None
+    driver_sms_number: Optional[str] = None
+    driver_rating: Optional[float] = None
+    driver_picture_url: Optional[str] = None
+    vehicle_make: Optional[str] = None
+    vehicle_model: Optional[str] = None
+    vehicle_license_plate: Optional[str] = None
+    vehicle_picture_url: Optional[str] = None
+    vehicle_color: Optional[str] = None
+    pickup_latitude: Optional[float] = None
+    pickup_longitude: Optional[float] = None
+    pickup_address: Optional[str] = None
+    pickup_eta: Optional[int] = None
+    destination_latitude: Optional[float] = None
+    destination_longitude: Optional[float] = None
+    destination_address: Optional[str] = None
+    destination_eta: Optional[int] = None
+    driver_latitude: Optional[float] = None
+    driver_longitude: Optional[float] = None
+    driver_bearing: Optional[float] = None
+    surge_multiplier: float = 1.0
+    fare: Optional[Dict[str, Any]] = None
+    shared: bool = False
+    progress_percentage: int = 0
+    # Attached by the coordinator while the ride is active
+    receipt: Optional[Dict[str, Any]] = None
+    map: Optional[Dict[str, Any]] = None
+
+
 class UberAPI:
     """Uber API client."""
 
@@ -71,38 +150,158 @@ class UberAPI:
         """Initialize the Uber API client."""
         self.hass = hass
         self._oauth_manager = oauth_manager
-        self._session = async_get_clientsession(hass)
-        self._rate_limit_remaining = RATE_LIMIT_CALLS
-        self._rate_limit_reset = datetime.now().timestamp() + RATE_LIMIT_WINDOW
+        self._session = async_get_uber_session(hass)
+        # One session for api.uber.com and the token endpoint alike, so a
+        # refresh reuses a warm connection instead of a separate pool
+        oauth_manager.attach_session(self._session)
+        # GET requests in flight, shared by callers asking for the same thing
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        # Last current-ride body and what it decoded and parsed to
+        self._last_ride_body: Optional[bytes] = None
+        self._last_ride_data: Optional[Dict[str, Any]] = None
+        self._last_ride_etag: Optional[str] = None
+        self._last_parsed_source: Optional[Dict[str, Any]] = None
+        self._last_parsed: Optional[ParsedRide] = None
+        # Loop time until which the current token needs no expiry check
+        self._token_good_until = 0.0
+        # Request headers, rebuilt only when the access token rotates
+        self._cached_headers: Dict[str, str] = {}
+        self._cached_for_token: Optional[str] = None
+        # Sliding window of per-second request counts covering the last
+        # RATE_LIMIT_WINDOW seconds, plus their running total
+        self._buckets: deque[List[int]] = deque(maxlen=RATE_LIMIT_WINDOW)
+        self._window_count = 0
+        # Quota the server last reported, counted down locally until the
+        # loop time at which the server resets it
+        self._server_remaining: Optional[int] = None
+        self._server_reset_at = 0.0
+
+    def _expire_buckets(self, now_sec: int) -> None:
+        """Drop the buckets that have slid out of the window."""
+        buckets = self._buckets
+        cutoff = now_sec - RATE_LIMIT_WINDOW
+        while buckets and buckets[0][0] <= cutoff:
+            self._window_count -= buckets.popleft()[1]
+
+    def _record_request(self, now_sec: int) -> None:
+        """Count a request against the bucket for the current second."""
+        buckets = self._buckets
+        if buckets and buckets[-1][0] == now_sec:
+            buckets[-1][1] += 1
+        else:
+            buckets.append([now_sec, 1])
+        self._window_count += 1
+        if self._server_remaining is not None:
+            self._server_remaining -= 1
+
+    def _update_server_quota(self, headers: Mapping[str, str]) -> None:
+        """Adopt the quota the server reports in its rate limit headers."""
+        remaining = headers.get(RATE_LIMIT_REMAINING_HEADER)
+        if remaining is None:
+            return
+        now = self.hass.loop.time()
+        self._server_remaining = int(remaining)
+        # The reset header is a Unix timestamp; without it assume a full window
+        reset = headers.get(RATE_LIMIT_RESET_HEADER)
+        self._server_reset_at = now + (
+            max(0.0, int(reset) - time.time())
+            if reset is not None
+            else RATE_LIMIT_WINDOW
+        )
+
+    async def _async_acquire_slot(self) -> None:
+        """Wait briefly for rate limit capacity, failing if it is further off."""
+        deadline = self.hass.loop.time() + RATE_LIMIT_MAX_WAIT
+        while True:
+            now = self.hass.loop.time()
+            now_sec = int(now)
+            self._expire_buckets(now_sec)
+            if self._server_remaining is not None and now >= self._server_reset_at:
+                self._server_remaining = None
+
+            resume_at = now
+            if self._window_count >= RATE_LIMIT_CALLS:
+                resume_at = self._buckets[0][0] + RATE_LIMIT_WINDOW
+            if self._server_remaining is not None and self._server_remaining <= 0:
+                resume_at = max(resume_at, self._server_reset_at)
+
+            if resume_at <= now:
+                self._record_request(now_sec)
+                return
+            wait_time = resume_at - now
+            if resume_at > deadline:
+                _LOGGER.warning("Rate limited for %.0f seconds", wait_time)
+                raise UberRateLimitError(f"Rate limited for {wait_time:.0f} seconds")
+            _LOGGER.debug("Rate limited. Waiting %.1f seconds", wait_time)
+            await asyncio.sleep(wait_time)
 
     async def _async_request(
         self,
         method: str,
-        endpoint: str,
+        url: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Make an authenticated request to the Uber API."""
-        # Check rate limiting
-        if self._rate_limit_remaining <= 0:
-            if datetime.now().timestamp() < self._rate_limit_reset:
-                wait_time = self._rate_limit_reset - datetime.now().timestamp()
-                _LOGGER.warning(
-                    "Rate limited. Waiting %s seconds before retry", wait_time
-                )
-                raise UberRateLimitError(f"Rate limited for {wait_time} seconds")
-            else:
-                # Reset rate limit
-                self._rate_limit_remaining = RATE_LIMIT_CALLS
-                self._rate_limit_reset = datetime.now().timestamp() + RATE_LIMIT_WINDOW
-
-        # Ensure valid token
-        await self._oauth_manager.async_ensure_valid_token()
-
-        url = f"{API_BASE_URL}{endpoint}"
-        headers = self._oauth_manager.get_authorization_header()
-        headers["Content-Type"] = "application/json"
-        headers["Accept-Language"] = "en_US"
+        """Make an authenticated request to the Uber API.
+
+        Identical GETs issued while one is already in flight share its result.
+        """
+        if method != "GET":
+            return await self._async_send_request(method, url, params, data)
+
+        key = (url, tuple(sorted(params.items())) if params else ())
+        if (task := self._inflight.get(key)) is None:
+            # Run the request as its own task so cancelling one caller never
+            # cancels it for the others sharing the result
+            task = self.hass.async_create_task(
+                self._async_send_request(method, url, params, data),
+                f"{DOMAIN} request {url}",
+            )
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._async_request_done, key))
+        return await asyncio.shield(task)
+
+    def _async_request_done(self, key: tuple, task: asyncio.Task) -> None:
+        """Forget a finished shared request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Keep "exception was never retrieved" quiet when every caller left
+        if not task.cancelled():
+            task.exception()
+
+    async def _async_send_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Send a request to the Uber API."""
+        # Wait briefly for rate limit capacity; fail fast when it is far off
+        await self._async_acquire_slot()
+
+        # Ensure valid token; skip the check entirely while it is known good
+        if self.hass.loop.time() >= self._token_good_until:
+            await self._oauth_manager.async_ensure_valid_token()
+            self._token_good_until = self._oauth_manager.refresh_at or 0.0
+
+        token = self._oauth_manager.access_token
+        if token is not self._cached_for_token:
+            self._cached_headers = {
+                **self._oauth_manager.get_authorization_header(),
+                "Content-Type": "application/json",
+                "Accept-Language": "en_US",
+            }
+            self._cached_for_token = token
+        headers = self._cached_headers
+        # Current-ride polls usually return the same body; let the server say so
+        is_ride_poll = url == URL_CURRENT_REQUEST
+        if (
+            is_ride_poll
+            and self._last_ride_etag is not None
+            and self._last_ride_data is not None
+        ):
+            headers = {**headers, "If-None-Match": self._last_ride_etag}
 
         try:
             async with self._session.request(
@@ -113,40 +312,31 @@ class UberAPI:
                 json=data,
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
             ) as response:
-                # Update rate limit info from headers
-                if "X-Rate-Limit-Remaining" in response.headers:
-                    self._rate_limit_remaining = int(
-                        response.headers["X-Rate-Limit-Remaining"]
-                    )
-                if "X-Rate-Limit-Reset" in response.headers:
-                    self._rate_limit_reset = int(response.headers["X-Rate-Limit-Reset"])
-
-                if response.status == 401:
-                    raise UberAuthenticationError("Authentication failed")
-                elif response.status == 429:
-                    raise UberRateLimitError("Rate limited")
-                elif response.status == 404:
-                    if endpoint == ENDPOINT_CURRENT_REQUEST:
-                        raise UberNoActiveRideError("No active ride found")
-                    raise UberAPIError(f"Resource not found: {endpoint}")
-                elif response.status >= 400:
-                    error_data = await response.json()
-                    error_msg = error_data.get("message", f"HTTP {response.status}")
-                    raise UberAPIError(f"API error: {error_msg}")
-
-                return await response.json()
+                # The server's view of our quota corrects the local window
+                self._update_server_quota(response.headers)
+
+                if response.status < 400:
+                    if not is_ride_poll:
+                        return await response.json(loads=json_loads)
+                    return await self._async_read_ride_body(response)
+
+                if (error_factory := _STATUS_ERRORS.get(response.status)) is not None:
+                    raise error_factory(url)
+                error_data = await response.json(loads=json_loads)
+                error_msg = error_data.get("message", f"HTTP {response.status}")
+                raise UberAPIError(f"API error: {error_msg}")
 
         except asyncio.TimeoutError:
-            _LOGGER.error("Request timeout for %s", endpoint)
+            _LOGGER.error("Request timeout for %s", url)
             raise UberAPIError("Request timeout")
         except aiohttp.ClientError as err:
-            _LOGGER.error("Request failed for %s: %s", endpoint, err)
+            _LOGGER.error("Request failed for %s: %s", url, err)
             raise UberAPIError(f"Request failed: {err}")
 
     async def async_get_current_ride(self) -> Optional[Dict[str, Any]]:
         """Get the current active ride."""
         try:
-            return await self._async_request("GET", ENDPOINT_CURRENT_REQUEST)
+            return await self._async_request("GET", URL_CURRENT_REQUEST)
         except UberNoActiveRideError:
             _LOGGER.debug("No active ride found")
             return None
@@ -156,63 +346,75 @@ class UberAPI:
 
     async def async_get_ride_details(self, request_id: str) -> Dict[str, Any]:
         """Get details for a specific ride."""
-        endpoint = ENDPOINT_REQUEST_DETAILS.format(request_id=request_id)
-        return await self._async_request("GET", endpoint)
+        url = _request_url(URL_REQUEST_DETAILS, request_id)
+        return await self._async_request("GET", url)
 
     async def async_get_ride_receipt(self, request_id: str) -> Dict[str, Any]:
         """Get receipt for a completed ride."""
-        endpoint = ENDPOINT_REQUEST_RECEIPT.format(request_id=request_id)
-        return await self._async_request("GET", endpoint)
+        url = _request_url(URL_REQUEST_RECEIPT, request_id)
+        return await self._async_request("GET", url)
 
     async def async_get_ride_map(self, request_id: str) -> Dict[str, Any]:
         """Get map data for a ride."""
-        endpoint = ENDPOINT_REQUEST_MAP.format(request_id=request_id)
-        return await self._async_request("GET", endpoint)
+        url = _request_url(URL_REQUEST_MAP, request_id)
+        return await self._async_request("GET", url)
 
     async def async_get_user_profile(self) -> Dict[str, Any]:
         """Get user profile information."""
-        return await self._async_request("GET", ENDPOINT_USER_PROFILE)
+        return await self._async_request("GET", URL_USER_PROFILE)
 
     async def async_get_trip_history(
         self, limit: int = 10, offset: int = 0
     ) -> List[Dict[str, Any]]:
         """Get trip history."""
         params = {"limit": limit, "offset": offset}
-        response = await self._async_request("GET", ENDPOINT_TRIP_HISTORY, params=params)
+        response = await self._async_request("GET", URL_TRIP_HISTORY, params=params)
         return response.get("history", [])
 
-    def parse_ride_data(self, ride_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _async_read_ride_body(
+        self, response: aiohttp.ClientResponse
+    ) -> Dict[str, Any]:
+        """Decode a current-ride body, reusing the last result if unchanged."""
+        if response.status == 304:
+            if self._last_ride_data is not None:
+                return self._last_ride_data
+            # Nothing cached to reuse; forget the ETag so the next poll is full
+            self._last_ride_etag = None
+            raise UberAPIError("Not modified response without cached ride data")
+        body = await response.read()
+        if body != self._last_ride_body or self._last_ride_data is None:
+            try:
+                data = json_loads(body)
+            except ValueError as err:
+                raise UberAPIError(f"Invalid ride response: {err}") from err
+            self._last_ride_body = body
+            self._last_ride_data = data
+        self._last_ride_etag = response.headers.get("ETag")
+        return self._last_ride_data
+
+    def parse_ride_data(self, ride_data: Dict[str, Any]) -> Optional[ParsedRide]:
         """Parse ride data into a structured format."""
         if not ride_data:
-            return {}
-
-        # Extract driver information
-        driver = ride_data.get("driver", {})
-        driver_info = {
-            "name": driver.get("name"),
-            "phone_number": driver.get("phone_number"),
-            "sms_number": driver.get("sms_number"),
-            "rating": driver.get("rating"),
-            "picture_url": driver.get("picture_url"),
-        }
-
-        # Extract vehicle information
-        vehicle = ride_data.get("vehicle", {})
-        vehicle_info = {
-            "make": vehicle.get("make"),
-            "model": vehicle.get("model"),
-            "license_plate": vehicle.get("license_plate"),
-            "picture_url": vehicle.get("picture_url"),
-            "color": vehicle.get("color"),
-        }
-
-        # Extract location information
-        location = ride_data.get("location", {})
-        pickup = ride_data.get("pickup", {})
-        destination = ride_data.get("destination", {})
+            return None
+        # The same decoded body comes back while the ride is unchanged; hand
+        # out a copy so callers attaching receipt/map never touch the cache
+        if ride_data is not self._last_parsed_source:
+            self._last_parsed = self._parse_ride_data(ride_data)
+            self._last_parsed_source = ride_data
+        return replace(self._last_parsed)
+
+    def _parse_ride_data(self, ride_data: Dict[str, Any]) -> ParsedRide:
+        """Build a ParsedRide from a current-ride response."""
+
+        get = ride_data.get
+        driver = get("driver") or _EMPTY
+        vehicle = get("vehicle") or _EMPTY
+        location = get("location") or _EMPTY
+        pickup = get("pickup") or _EMPTY
+        destination = get("destination") or _EMPTY
 
         # Calculate progress
-        status = ride_data.get("status")
+        status = get("status")
         progress = 0
         if status == "completed":
             progress = 100
@@ -221,37 +423,42 @@ class UberAPI:
             # In reality, you'd need to calculate based on route distance
             progress = 50
 
-        # Parse the response
-        parsed_data = {
-            "request_id": ride_data.get("request_id"),
-            "product_id": ride_data.get("product_id"),
-            "status": status,
-            "driver": driver_info,
-            "vehicle": vehicle_info,
-            "pickup": {
-                "latitude": pickup.get("latitude"),
-                "longitude": pickup.get("longitude"),
-                "address": pickup.get("address"),
-                "eta": pickup.get("eta"),
-            },
-            "destination": {
-                "latitude": destination.get("latitude"),
-                "longitude": destination.get("longitude"),
-                "address": destination.get("address"),
-                "eta": destination.get("eta"),
-            },
-            "location": {
-                "latitude": location.get("latitude"),
-                "longitude": location.get("longitude"),
-                "bearing": location.get("bearing"),
-            },
-            "surge_multiplier": ride_data.get("surge_multiplier", 1.0),
-            "fare": ride_data.get("fare"),
-            "shared": ride_data.get("shared", False),
-            "progress_percentage": progress,
-        }
-
-        return parsed_data
+        driver_get = driver.get
+        vehicle_get = vehicle.get
+        location_get = location.get
+        pickup_get = pickup.get
+        destination_get = destination.get
+
+        return ParsedRide(
+            request_id=get("request_id"),
+            product_id=get("product_id"),
+            status=status,
+            driver_name=driver_get("name"),
+            driver_phone_number=driver_get("phone_number"),
+            driver_sms_number=driver_get("sms_number"),
+            driver_rating=driver_get("rating"),
+            driver_picture_url=driver_get("picture_url"),
+            vehicle_make=vehicle_get("make"),
+            vehicle_model=vehicle_get("model"),
+            vehicle_license_plate=vehicle_get("license_plate"),
+            vehicle_picture_url=vehicle_get("picture_url"),
+            vehicle_color=vehicle_get("color"),
+            pickup_latitude=pickup_get("latitude"),
+            pickup_longitude=pickup_get("longitude"),
+            pickup_address=pickup_get("address"),
+            pickup_eta=pickup_get("eta"),
+            destination_latitude=destination_get("latitude"),
+            destination_longitude=destination_get("longitude"),
+            destination_address=destination_get("address"),
+            destination_eta=destination_get("eta"),
+            driver_latitude=location_get("latitude"),
+            driver_longitude=location_get("longitude"),
+            driver_bearing=location_get("bearing"),
+            surge_multiplier=get("surge_multiplier", 1.0),
+            fare=get("fare"),
+            shared=get("shared", False),
+            progress_percentage=progress,
+        )
 
     async def async_test_connection(self) -> bool:
         """Test the API connection."""
@@ -1,61 +1,127 @@
 """Simple Uber API client for testing without OAuth."""
+import asyncio
+import functools
 import logging
 import aiohttp
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, Mapping
+from datetime import datetime
 from urllib.parse import urlencode
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 API_BASE_URL = "https://api.uber.com"
+CURRENT_RIDE_URL = f"{API_BASE_URL}/v1.2/requests/current"
+RIDE_HISTORY_URL = f"{API_BASE_URL}/v1.2/history"
+TOKEN_URL = "https://auth.uber.com/oauth/v2/token"
+AUTHORIZE_URL = "https://auth.uber.com/oauth/v2/authorize"
+# Use your actual Home Assistant domain
+# This should be added to your Uber app's redirect URIs
+REDIRECT_URI = "https://home.erbarraud.com/local/uber_callback.html"
+# Refresh this many seconds before the access token actually expires
+TOKEN_REFRESH_MARGIN = 60
+
+# Failures a request can raise: transport errors, timeouts and bad JSON
+# bodies. Anything else, cancellation included, propagates.
+_REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+
+# Shared, read-only stand-in for missing sub-objects
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+@callback
+def async_get_uber_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the session shared by every Uber client of this instance.
+
+    It is made with Home Assistant's helper, so it carries Home Assistant's
+    SSL context and User-Agent and is closed at shutdown. Clients must make
+    all of their requests, token grants included, on this one session:
+    aiohttp pools per host inside a session, never across sessions.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (session := domain_data.get("_session")) is None:
+        session = domain_data["_session"] = async_create_clientsession(hass)
+    return session
 
 
 class UberAPIClient:
     """Uber API client for ride tracking."""
     
-    def __init__(self, hass: HomeAssistant, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client_id: str,
+        client_secret: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         """Initialize the API client."""
         self.hass = hass
         self.client_id = client_id
         self.client_secret = client_secret
-        self.session = async_get_clientsession(hass)
+        # Everything but the state is fixed for this client, so encode it once.
+        # Don't request specific scopes to avoid invalid_scope error; Uber will
+        # grant default scopes based on app configuration.
+        self._auth_url_base = f"{AUTHORIZE_URL}?" + urlencode({
+            "client_id": client_id,
+            "response_type": "code",
+            "redirect_uri": REDIRECT_URI,
+        })
+        # Pooled connections are reused across every request this client makes
+        self.session = session or async_get_uber_session(hass)
         self.access_token = None
-        self.token_expires = None
+        # Expiry on the event loop's monotonic clock
+        self.token_expires: Optional[float] = None
         self.refresh_token = None
+        # Request headers, rebuilt only when the access token changes
+        self._headers: Dict[str, str] = {}
+        self._headers_token: Optional[str] = None
+        # Serializes refreshes so concurrent polls don't each post a grant
+        self._token_lock = asyncio.Lock()
+        # Requests currently in flight, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Last test_connection result, dropped when a new token is granted
+        self._connection_result: Optional[Dict[str, Any]] = None
+        
+    def _auth_headers(self) -> Dict[str, str]:
+        """Return the headers for authenticated requests."""
+        if self.access_token is not self._headers_token:
+            self._headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            }
+            self._headers_token = self.access_token
+        return self._headers
+        
+    async def close(self) -> None:
+        """Cancel requests still in flight; the shared session stays open."""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
         
     async def test_connection(self) -> Dict[str, Any]:
         """Test if we can connect to Uber API."""
+        if self._connection_result is not None:
+            # Callers get their own copy so the cached result stays intact
+            return dict(self._connection_result)
+        
         # Note: Uber requires OAuth2 authorization code flow for user data
         # Client credentials flow doesn't work for accessing ride data
         
-        # Generate OAuth URL for user authorization
-        from urllib.parse import urlencode
-        
-        # Use your actual Home Assistant domain  
-        # This should be added to your Uber app's redirect URIs
-        redirect_uri = "https://home.erbarraud.com/local/uber_callback.html"
-        
-        # Don't request specific scopes to avoid invalid_scope error
-        # Uber will grant default scopes based on app configuration
-        auth_params = {
-            "client_id": self.client_id,
-            "response_type": "code",
-            "redirect_uri": redirect_uri,
-            "state": "ha_uber_tracker"
-            # Removed scope parameter - let Uber use defaults
-        }
-        
-        auth_url = f"https://auth.uber.com/oauth/v2/authorize?{urlencode(auth_params)}"
+        redirect_uri = REDIRECT_URI
+        auth_url = f"{self._auth_url_base}&state=ha_uber_tracker"
         
         _LOGGER.warning(
             "Uber API requires OAuth user authorization. "
             "Please visit the authorization URL and grant access."
         )
         
-        return {
+        self._connection_result = {
             "success": False,
             "requires_oauth": True,
             "auth_url": auth_url,
@@ -63,12 +129,13 @@ class UberAPIClient:
             "redirect_uri": redirect_uri,
             "redirect_uri_info": f"Add this to your Uber app redirect URIs: {redirect_uri}"
         }
+        return dict(self._connection_result)
     
     async def exchange_auth_code(self, auth_code: str, redirect_uri: str = None) -> Dict[str, Any]:
         """Exchange authorization code for access token."""
         # Use the same redirect URI that was used for authorization
         if not redirect_uri:
-            redirect_uri = "https://home.erbarraud.com/local/uber_callback.html"
+            redirect_uri = REDIRECT_URI
             
         token_data = {
             "client_id": self.client_id,
@@ -80,16 +147,23 @@ class UberAPIClient:
         
         try:
             async with self.session.post(
-                "https://auth.uber.com/oauth/v2/token",
+                TOKEN_URL,
                 data=token_data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"}
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
+                    if not isinstance(data, dict):
+                        _LOGGER.error("Unexpected token response: %s", data)
+                        return {
+                            "success": False,
+                            "error": "Unexpected response body",
+                        }
                     self.access_token = data.get("access_token")
                     self.refresh_token = data.get("refresh_token")
                     expires_in = data.get("expires_in", 3600)
-                    self.token_expires = datetime.now() + timedelta(seconds=expires_in)
+                    self.token_expires = self.hass.loop.time() + expires_in
+                    self._connection_result = None
                     
                     _LOGGER.info("Successfully obtained Uber access token")
                     return {
@@ -106,44 +180,111 @@ class UberAPIClient:
                         "error": f"HTTP {response.status}",
                         "details": error_text
                     }
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Error exchanging auth code: %s", e)
             return {
                 "success": False,
                 "error": str(e)
             }
     
-    async def get_current_ride(self) -> Optional[Dict[str, Any]]:
-        """Get current ride information."""
-        if not self.access_token:
-            _LOGGER.warning("No access token available")
-            # Try to get a new token
-            await self.test_connection()
+    def _token_is_fresh(self) -> bool:
+        """Return True if the access token is not close to expiring."""
+        return bool(self.access_token) and (
+            self.token_expires is None
+            or self.hass.loop.time() + TOKEN_REFRESH_MARGIN < self.token_expires
+        )
+    
+    async def _ensure_token(self) -> bool:
+        """Make sure there is an access token, refreshing it when it is about to expire."""
+        if self._token_is_fresh():
+            return True
+        if not self.refresh_token:
             if not self.access_token:
-                return None
+                _LOGGER.warning("No access token available")
+            return bool(self.access_token)
         
-        # Check if token expired
-        if self.token_expires and datetime.now() > self.token_expires:
-            _LOGGER.info("Token expired, refreshing...")
-            await self.test_connection()
+        async with self._token_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not self._token_is_fresh():
+                await self._refresh_access_token()
+        return bool(self.access_token)
+    
+    async def _refresh_access_token(self) -> None:
+        """Trade the refresh token for a new access token."""
+        _LOGGER.info("Token expired, refreshing...")
+        token_data = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "grant_type": "refresh_token",
+            "refresh_token": self.refresh_token,
+        }
         
-        if not self.access_token:
+        try:
+            async with self.session.post(
+                TOKEN_URL,
+                data=token_data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"}
+            ) as response:
+                if response.status != 200:
+                    _LOGGER.error(
+                        "Failed to refresh token: HTTP %s - %s",
+                        response.status,
+                        await response.text(),
+                    )
+                    return
+                data = await response.json(loads=json_loads)
+        except _REQUEST_ERRORS as e:
+            _LOGGER.error("Error refreshing token: %s", e)
+            return
+        if not isinstance(data, dict):
+            _LOGGER.error("Unexpected token refresh response: %s", data)
+            return
+        
+        self.access_token = data.get("access_token")
+        self.refresh_token = data.get("refresh_token", self.refresh_token)
+        self.token_expires = self.hass.loop.time() + data.get("expires_in", 3600)
+    
+    async def get_current_ride(self) -> Optional[Dict[str, Any]]:
+        """Get current ride information, joining any request already in flight."""
+        task = self._inflight.get("current_ride")
+        if task is None:
+            task = self.hass.async_create_task(
+                self._fetch_current_ride(), name="uber_current_ride"
+            )
+            self._inflight["current_ride"] = task
+            task.add_done_callback(
+                functools.partial(self._async_request_done, "current_ride")
+            )
+        # Shield so one caller being cancelled doesn't cancel the shared request
+        return await asyncio.shield(task)
+    
+    def _async_request_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished shared request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Keep "exception was never retrieved" quiet when every caller left
+        if not task.cancelled():
+            task.exception()
+    
+    async def _fetch_current_ride(self) -> Optional[Dict[str, Any]]:
+        """Fetch current ride information from the API."""
+        if not await self._ensure_token():
             return None
             
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+        headers = self._auth_headers()
         
         try:
             # Try to get current ride
             async with self.session.get(
-                f"{API_BASE_URL}/v1.2/requests/current",
+                CURRENT_RIDE_URL,
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    ride_data = await response.json()
-                    _LOGGER.info("Found active ride: %s", ride_data.get("status"))
+                    ride_data = await response.json(loads=json_loads)
+                    if not isinstance(ride_data, dict):
+                        _LOGGER.error("Unexpected current ride body: %s", ride_data)
+                        return None
+                    _LOGGER.debug("Found active ride: %s", ride_data.get("status"))
                     return self._parse_ride_data(ride_data)
                 elif response.status == 404:
                     _LOGGER.debug("No active ride")
@@ -160,7 +301,7 @@ class UberAPIClient:
                     _LOGGER.error("Error getting ride: HTTP %s - %s", response.status, error_text)
                     return None
                     
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Error fetching current ride: %s", e)
             return None
     
@@ -169,7 +310,8 @@ class UberAPIClient:
         if not data:
             return {"status": "no_active_ride", "has_ride": False}
         
-        # Extract relevant information
+        # Build the result in one literal; sections are only present when the
+        # API returned the matching sub-object
         result = {
             "has_ride": True,
             "status": data.get("status", "unknown"),
@@ -177,59 +319,47 @@ class UberAPIClient:
             "product_id": data.get("product_id"),
             "eta": data.get("eta"),  # Arrival time in minutes
             "surge_multiplier": data.get("surge_multiplier", 1.0),
-        }
-        
-        # Driver information
-        if driver := data.get("driver"):
-            result.update({
+            # Driver information
+            **({
                 "driver_name": driver.get("name"),
                 "driver_phone": driver.get("phone_number"),
                 "driver_rating": driver.get("rating"),
                 "driver_picture_url": driver.get("picture_url"),
-            })
-        
-        # Vehicle information
-        if vehicle := data.get("vehicle"):
-            result.update({
+            } if isinstance(driver := data.get("driver"), dict) else _EMPTY),
+            # Vehicle information
+            **({
                 "vehicle_make": vehicle.get("make"),
                 "vehicle_model": vehicle.get("model"),
                 "vehicle_license_plate": vehicle.get("license_plate"),
                 "vehicle_color": vehicle.get("color"),
                 "vehicle_picture_url": vehicle.get("picture_url"),
-            })
-        
-        # Location information
-        if location := data.get("location"):
-            result.update({
+            } if isinstance(vehicle := data.get("vehicle"), dict) else _EMPTY),
+            # Location information
+            **({
                 "driver_latitude": location.get("latitude"),
                 "driver_longitude": location.get("longitude"),
                 "driver_bearing": location.get("bearing"),
-            })
-        
-        # Pickup and destination
-        if pickup := data.get("pickup"):
-            result.update({
+            } if isinstance(location := data.get("location"), dict) else _EMPTY),
+            # Pickup and destination
+            **({
                 "pickup_address": pickup.get("alias") or pickup.get("name") or pickup.get("address"),
                 "pickup_latitude": pickup.get("latitude"),
                 "pickup_longitude": pickup.get("longitude"),
                 "pickup_eta": pickup.get("eta"),
-            })
-        
-        if destination := data.get("destination"):
-            result.update({
+            } if isinstance(pickup := data.get("pickup"), dict) else _EMPTY),
+            **({
                 "destination_address": destination.get("alias") or destination.get("name") or destination.get("address"),
                 "destination_latitude": destination.get("latitude"),
                 "destination_longitude": destination.get("longitude"),
                 "destination_eta": destination.get("eta"),
-            })
-        
-        # Trip information
-        if trip := data.get("trip"):
-            result.update({
+            } if isinstance(destination := data.get("destination"), dict) else _EMPTY),
+            # Trip information
+            **({
                 "distance_estimate": trip.get("distance_estimate"),
                 "duration_estimate": trip.get("duration_estimate"),
                 "fare_estimate": trip.get("fare_estimate"),
-            })
+            } if isinstance(trip := data.get("trip"), dict) else _EMPTY),
+        }
         
         # Calculate progress if in trip
         if result["status"] == "in_progress" and "duration_estimate" in result:
@@ -243,10 +373,7 @@ class UberAPIClient:
         if not self.access_token or not request_id:
             return None
             
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+        headers = self._auth_headers()
         
         try:
             async with self.session.get(
@@ -254,10 +381,10 @@ class UberAPIClient:
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await response.json(loads=json_loads)
                 else:
                     return None
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Error fetching receipt: %s", e)
             return None
     
@@ -283,10 +410,7 @@ class UberAPIClient:
         
         results["token_valid"] = True
         
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+        headers = self._auth_headers()
         
         # Test endpoints - v1.2 API endpoints
         # Note: Some endpoints require specific scopes
@@ -299,7 +423,7 @@ class UberAPIClient:
             ("/v1/products", "Available Products"),  # Public endpoint, no auth needed
         ]
         
-        for endpoint, description in endpoints_to_test:
+        async def _probe(endpoint: str, description: str) -> Dict[str, Any]:
             try:
                 # Add latitude/longitude for products endpoint
                 params = {}
@@ -322,17 +446,20 @@ class UberAPIClient:
                     }
                     
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=json_loads)
+                        if not isinstance(data, dict):
+                            data = _EMPTY
                         if endpoint == "/v1.2/me":
                             result["sample_data"] = {
                                 "email": data.get("email"),
                                 "name": f"{data.get('first_name', '')} {data.get('last_name', '')}",
-                                "uuid": data.get("uuid", "")[:8] + "..."
+                                "uuid": (data.get("uuid") or "")[:8] + "..."
                             }
                         elif endpoint == "/v1.2/history":
+                            count = data.get("count") or 0
                             result["sample_data"] = {
-                                "count": data.get("count", 0),
-                                "has_rides": data.get("count", 0) > 0
+                                "count": count,
+                                "has_rides": count > 0
                             }
                         elif endpoint == "/v1.2/requests/current":
                             result["sample_data"] = {"has_active_ride": True}
@@ -344,41 +471,51 @@ class UberAPIClient:
                     else:
                         result["error"] = await response.text()
                     
-                    results["accessible_endpoints"].append(result)
+                    return result
                     
-            except Exception as e:
-                results["accessible_endpoints"].append({
+            except _REQUEST_ERRORS as e:
+                return {
                     "endpoint": endpoint,
                     "description": description,
                     "error": str(e),
                     "accessible": False
-                })
+                }
+        
+        # Probe every endpoint concurrently; results keep the listed order
+        results["accessible_endpoints"] = list(await asyncio.gather(
+            *(_probe(endpoint, description) for endpoint, description in endpoints_to_test)
+        ))
         
         return results
     
     async def get_ride_history(self, limit: int = 5) -> Optional[Dict[str, Any]]:
         """Get ride history."""
-        if not self.access_token:
-            await self.test_connection()
-            if not self.access_token:
-                return None
+        if not await self._ensure_token():
+            return None
         
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+        headers = self._auth_headers()
         
         try:
             async with self.session.get(
-                f"{API_BASE_URL}/v1.2/history",
+                RIDE_HISTORY_URL,
                 headers=headers,
                 params={"limit": limit, "offset": 0}
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
+                    if not isinstance(data, dict):
+                        return {
+                            "success": False,
+                            "error": "Unexpected response body",
+                            "details": str(data),
+                        }
                     return {
                         "count": data.get("count", 0),
-                        "rides": data.get("history", []),
+                        "rides": [
+                            ride
+                            for ride in data.get("history") or ()
+                            if isinstance(ride, dict)
+                        ],
                         "success": True
                     }
                 else:
@@ -387,9 +524,24 @@ class UberAPIClient:
                         "error": f"HTTP {response.status}",
                         "details": await response.text()
                     }
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
             _LOGGER.error("Error fetching ride history: %s", e)
             return {
                 "success": False,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+    
+    async def run_diagnostics(
+        self,
+        include: Iterable[str] = ("access", "history", "current"),
+        limit: int = 5,
+    ) -> Dict[str, Any]:
+        """Run the requested diagnostics concurrently on the shared session."""
+        probes = {
+            "access": self.test_api_access,
+            "history": lambda: self.get_ride_history(limit),
+            "current": self.get_current_ride,
+        }
+        names = [name for name in include if name in probes]
+        results = await asyncio.gather(*(probes[name]() for name in names))
+        return dict(zip(names, results))
@@ -3,11 +3,13 @@ import logging
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, NAME
+from .const import ACTIVE_RIDE_STATUSES, DOMAIN
+from .current_ride_coordinator import UberCurrentRideCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,38 +22,43 @@ async def async_setup_entry(
     """Set up Uber Ride Tracker binary sensors from a config entry."""
     
     sensors = [
-        UberRideActiveBinarySensor(entry),
+        UberRideActiveBinarySensor(
+            entry.runtime_data.coordinator, entry, entry.runtime_data.device_info
+        ),
     ]
     
     async_add_entities(sensors)
 
 
-class UberRideActiveBinarySensor(BinarySensorEntity):
+class UberRideActiveBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Binary sensor for active Uber ride."""
 
     _attr_icon = "mdi:car-connected"
     _attr_has_entity_name = True
 
-    def __init__(self, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: UberCurrentRideCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the binary sensor."""
+        super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_ride_active"
         # This will create entity_id: binary_sensor.uber_ride_tracker_ride_active
         self.entity_id = f"binary_sensor.{DOMAIN}_ride_active"
         self._attr_name = "Ride Active"
+        self._attr_device_info = device_info
+        self._update_from_data()
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if a ride is active."""
-        return False  # No active ride until OAuth is implemented
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=NAME,
-            manufacturer=MANUFACTURER,
-            model="Ride Tracker",
-            sw_version="1.0.0",
-        )
\ No newline at end of file
+    def _update_from_data(self) -> None:
+        """Cache the on/off state from the latest coordinator data."""
+        ride = self.coordinator.data
+        self._attr_is_on = ride is not None and ride.get("status") in ACTIVE_RIDE_STATUSES
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
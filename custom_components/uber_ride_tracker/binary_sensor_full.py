@@ -1,17 +1,18 @@
 """Binary sensor platform for Uber Ride Tracker."""
 import logging
-from typing import Any, Dict, Optional
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import ParsedRide
 from .const import (
     ACTIVE_RIDE_STATUSES,
     DOMAIN,
@@ -54,52 +55,46 @@ class UberRideActiveBinarySensor(CoordinatorEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_ride_active"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if a ride is active."""
-        if not self.coordinator.data:
-            return False
-        
-        if not self.coordinator.data.get("has_active_ride"):
-            return False
-        
-        ride = self.coordinator.data.get("ride", {})
-        status = ride.get("status")
-        
-        return status in ACTIVE_RIDE_STATUSES
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
-            return {
-                "status": "no_active_ride",
-                "last_check": self.coordinator.data.get("last_update") if self.coordinator.data else None,
-            }
-        
-        ride = self.coordinator.data.get("ride", {})
-        
-        return {
-            "status": ride.get("status"),
-            "trip_id": ride.get("request_id"),
-            "pickup_address": ride.get("pickup", {}).get("address"),
-            "destination_address": ride.get("destination", {}).get("address"),
-            "last_update": self.coordinator.data.get("last_update"),
-        }
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
+        # Never changes, so build it once rather than per property access
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
             name=NAME,
             manufacturer=MANUFACTURER,
             model="Ride Tracker",
             sw_version="1.0.0",
         )
+        # Coordinator data the state was last computed from; starts as a
+        # sentinel so the first computation always runs, even for None data
+        self._last_data: Any = object()
+        self._update_from_data()
+
+    def _update_from_data(self) -> None:
+        """Recompute state and attributes from the coordinator data."""
+        data = self.coordinator.data
+        if data is self._last_data:
+            return
+        self._last_data = data
+
+        if not data or not data.get("has_active_ride"):
+            self._attr_is_on = False
+            self._attr_extra_state_attributes = {
+                "status": "no_active_ride",
+                "last_check": self.coordinator.last_update,
+            }
+            return
+
+        ride: ParsedRide = data["ride"]
+        self._attr_is_on = ride.status in ACTIVE_RIDE_STATUSES
+        self._attr_extra_state_attributes = {
+            "status": ride.status,
+            "trip_id": ride.request_id,
+            "pickup_address": ride.pickup_address,
+            "destination_address": ride.destination_address,
+            "last_update": self.coordinator.last_update,
+        }
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
\ No newline at end of file
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
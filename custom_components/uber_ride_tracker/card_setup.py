@@ -1,11 +1,13 @@
 """Card setup utilities for Uber Ride Tracker."""
-import json
 import logging
 from pathlib import Path
-from typing import Dict, Any
 
-from homeassistant.core import HomeAssistant
-from homeassistant.util import yaml
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,66 +15,132 @@ CARD_FILENAME = "uber-ride-tracker-card.js"
 CALLBACK_FILENAME = "uber_callback.html"
 CARD_URL = f"/local/{CARD_FILENAME}"
 CALLBACK_URL = f"/local/{CALLBACK_FILENAME}"
+CARD_ELEMENT_MARKER = b"customElements.define('uber-ride-tracker-card'"
+
+# Bundled copies of the card and callback page shipped with the integration
+INTEGRATION_WWW_DIR = Path(__file__).parent / "www"
+CARD_SOURCE = INTEGRATION_WWW_DIR / CARD_FILENAME
+CALLBACK_SOURCE = INTEGRATION_WWW_DIR / CALLBACK_FILENAME
 
 
 async def ensure_card_installed(hass: HomeAssistant) -> bool:
     """Ensure the card is installed and registered."""
-    success = True
+    registered_urls = _registered_card_urls(hass)
+    domain_data = hass.data[DOMAIN]
     
-    # Step 1: Copy card file to www folder
-    if not await copy_card_to_www(hass):
-        success = False
+    # Copy, register and verify in a single executor job
+    copied, registered, verified_sig = await hass.async_add_executor_job(
+        _sync_install_card,
+        Path(hass.config.path("www")),
+        Path(hass.config.path(".storage/lovelace_resources")),
+        _needs_registration(hass, registered_urls),
+        domain_data.get("_card_verified_sig"),
+    )
+    domain_data["_card_verified_sig"] = verified_sig
     
-    # Step 2: Register as lovelace resource
-    if not await register_lovelace_resource(hass):
+    if registered:
+        registered_urls.add(CARD_URL)
+    else:
         _LOGGER.warning("Could not auto-register resource, manual registration needed")
         # Don't fail the whole setup for this
     
-    # Step 3: Verify installation
-    if await verify_card_installation(hass):
+    if verified_sig is not None:
         _LOGGER.info("Card installation verified successfully")
     else:
         _LOGGER.warning("Card installation could not be verified")
     
-    return success
+    return copied
+
+
+def _sync_install_card(
+    www_path: Path,
+    resources_path: Path,
+    register: bool,
+    verified_sig: tuple[int, int] | None,
+) -> tuple[bool, bool, tuple[int, int] | None]:
+    """Copy, register and verify the card, running in the executor.
+
+    Returns the installed card's (size, mtime) signature in place of the
+    verify result, so an unchanged card is not verified again.
+    """
+    copied = _sync_copy_card_to_www(www_path)
+    registered = not register or _sync_register_lovelace_resource(resources_path)
+    sig = _card_signature(www_path / CARD_FILENAME)
+    if sig is None or (sig != verified_sig and not _sync_verify_card_installation(www_path)):
+        sig = None
+    return copied, registered, sig
+
+
+def _card_signature(card_path: Path) -> tuple[int, int] | None:
+    """Return the (size, mtime) of the installed card, or None if missing."""
+    try:
+        stat = card_path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _registered_card_urls(hass: HomeAssistant) -> set[str]:
+    """Return the card URLs registered since Home Assistant started."""
+    return hass.data.setdefault(DOMAIN, {}).setdefault("_registered_card_urls", set())
+
+
+def _needs_registration(hass: HomeAssistant, registered_urls: set[str]) -> bool:
+    """Return True if the card still has to be added to the resources file."""
+    if CARD_URL in registered_urls:
+        # Already registered since Home Assistant started, skip the storage scan
+        return False
+    
+    # The resources file is ignored when lovelace runs in YAML mode
+    if getattr(hass.data.get("lovelace"), "mode", None) == "yaml":
+        _LOGGER.info(
+            "Lovelace is in YAML mode, add %s as a module resource manually", CARD_URL
+        )
+        registered_urls.add(CARD_URL)
+        return False
+    
+    return True
 
 
 async def copy_card_to_www(hass: HomeAssistant) -> bool:
     """Copy the card and callback files to www folder."""
+    return await hass.async_add_executor_job(
+        _sync_copy_card_to_www, Path(hass.config.path("www"))
+    )
+
+
+def _sync_copy_card_to_www(www_path: Path) -> bool:
+    """Copy the card and callback files, running in the executor."""
     try:
-        # Get paths
-        www_path = Path(hass.config.path("www"))
-        
-        # Path to the files in the integration
-        integration_dir = Path(__file__).parent
-        
         # Create www directory if it doesn't exist
         if not www_path.exists():
             _LOGGER.info("Creating www directory at %s", www_path)
             www_path.mkdir(mode=0o755, parents=True, exist_ok=True)
         
-        import shutil
-        
         # Copy card file
-        card_source = integration_dir / "www" / CARD_FILENAME
+        card_source = CARD_SOURCE
         card_dest = www_path / CARD_FILENAME
         
         if card_source.exists():
-            shutil.copy2(str(card_source), str(card_dest))
-            card_dest.chmod(0o644)
-            _LOGGER.info("Card copied to %s", card_dest)
+            if _is_up_to_date(card_source, card_dest):
+                _LOGGER.debug("Card at %s is up to date", card_dest)
+            else:
+                _copy_public_file(card_source, card_dest)
+                _LOGGER.info("Card copied to %s", card_dest)
         else:
             _LOGGER.error("Card source file not found at %s", card_source)
             return False
             
         # Copy callback HTML file
-        callback_source = integration_dir / "www" / CALLBACK_FILENAME
+        callback_source = CALLBACK_SOURCE
         callback_dest = www_path / CALLBACK_FILENAME
         
         if callback_source.exists():
-            shutil.copy2(str(callback_source), str(callback_dest))
-            callback_dest.chmod(0o644)
-            _LOGGER.info("Callback page copied to %s", callback_dest)
+            if _is_up_to_date(callback_source, callback_dest):
+                _LOGGER.debug("Callback page at %s is up to date", callback_dest)
+            else:
+                _copy_public_file(callback_source, callback_dest)
+                _LOGGER.info("Callback page copied to %s", callback_dest)
         else:
             _LOGGER.warning("Callback HTML not found at %s", callback_source)
             # Don't fail if callback is missing, it might be added manually
@@ -84,16 +152,51 @@ async def copy_card_to_www(hass: HomeAssistant) -> bool:
         return False
 
 
+def _copy_public_file(source: Path, dest: Path) -> None:
+    """Copy source to dest and make it world-readable."""
+    # Only needed on first install or upgrade, so defer the import until then
+    import shutil
+    
+    shutil.copy2(str(source), str(dest))
+    dest.chmod(0o644)
+
+
+def _is_up_to_date(source: Path, dest: Path) -> bool:
+    """Return True if dest already matches source by size and mtime."""
+    try:
+        dest_stat = dest.stat()
+    except FileNotFoundError:
+        return False
+    source_stat = source.stat()
+    # copy2 preserves mtime, so an unchanged copy is never older than its source
+    return (
+        dest_stat.st_size == source_stat.st_size
+        and dest_stat.st_mtime >= source_stat.st_mtime
+    )
+
+
 async def register_lovelace_resource(hass: HomeAssistant) -> bool:
     """Register the card as a lovelace resource."""
+    registered_urls = _registered_card_urls(hass)
+    if not _needs_registration(hass, registered_urls):
+        return True
+    
+    if not await hass.async_add_executor_job(
+        _sync_register_lovelace_resource,
+        Path(hass.config.path(".storage/lovelace_resources")),
+    ):
+        return False
+    
+    registered_urls.add(CARD_URL)
+    return True
+
+
+def _sync_register_lovelace_resource(resources_path: Path) -> bool:
+    """Add the card to the lovelace resources file, running in the executor."""
     try:
-        # Path to lovelace resources storage
-        resources_path = Path(hass.config.path(".storage/lovelace_resources"))
-        
         # Load existing resources or create new
         if resources_path.exists():
-            with open(resources_path, "r") as f:
-                data = json.load(f)
+            data = json_loads(resources_path.read_bytes())
         else:
             data = {
                 "version": 1,
@@ -106,10 +209,9 @@ async def register_lovelace_resource(hass: HomeAssistant) -> bool:
         
         # Check if already registered
         resources = data.get("data", {}).get("resources", [])
-        for resource in resources:
-            if resource.get("url") == CARD_URL:
-                _LOGGER.debug("Card already registered as resource")
-                return True
+        if CARD_URL in {resource.get("url") for resource in resources}:
+            _LOGGER.debug("Card already registered as resource")
+            return True
         
         # Add new resource
         new_resource = {
@@ -124,8 +226,7 @@ async def register_lovelace_resource(hass: HomeAssistant) -> bool:
         
         # Write back to file
         resources_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(resources_path, "w") as f:
-            json.dump(data, f, indent=2)
+        resources_path.write_bytes(json_bytes(data))
         
         _LOGGER.info("Card registered as lovelace resource")
         return True
@@ -137,9 +238,15 @@ async def register_lovelace_resource(hass: HomeAssistant) -> bool:
 
 async def verify_card_installation(hass: HomeAssistant) -> bool:
     """Verify the card is properly installed."""
+    return await hass.async_add_executor_job(
+        _sync_verify_card_installation, Path(hass.config.path("www"))
+    )
+
+
+def _sync_verify_card_installation(www_path: Path) -> bool:
+    """Check the installed card file, running in the executor."""
     try:
         # Check if file exists
-        www_path = Path(hass.config.path("www"))
         card_path = www_path / CARD_FILENAME
         
         if not card_path.exists():
@@ -147,13 +254,16 @@ async def verify_card_installation(hass: HomeAssistant) -> bool:
             return False
         
         # Check file size (should be around 13KB)
-        size = card_path.stat().st_size
+        content = card_path.read_bytes()
+        size = len(content)
         if size < 1000:
             _LOGGER.error("Card file seems too small: %d bytes", size)
             return False
         
-        # Skip content check to avoid blocking I/O
-        # Just verify file exists and has reasonable size
+        # Search the raw bytes so the whole script is never decoded
+        if CARD_ELEMENT_MARKER not in content:
+            _LOGGER.error("Card file does not define the custom element")
+            return False
         
         _LOGGER.info("Card installation verified: %s (%d bytes)", card_path, size)
         return True
@@ -163,10 +273,7 @@ async def verify_card_installation(hass: HomeAssistant) -> bool:
         return False
 
 
-async def show_setup_instructions(hass: HomeAssistant, success: bool) -> None:
-    """Show setup instructions to the user."""
-    if success:
-        message = """
+_SUCCESS_MESSAGE = """
 ## ✅ Uber Ride Tracker Ready!
 
 The integration and custom card have been installed successfully.
@@ -188,8 +295,8 @@ entity: sensor.uber_ride_tracker_ride_status
 - Restart Home Assistant if needed
 - Check browser console for errors (F12)
 """
-    else:
-        message = """
+
+_FAILURE_MESSAGE = """
 ## ⚠️ Uber Ride Tracker - Manual Setup Needed
 
 The integration is installed but the card needs manual setup:
@@ -209,14 +316,16 @@ type: custom:uber-ride-tracker-card
 entity: sensor.uber_ride_tracker_ride_status
 ```
 """
+
+
+@callback
+def show_setup_instructions(hass: HomeAssistant, success: bool) -> None:
+    """Show setup instructions to the user."""
+    message = _SUCCESS_MESSAGE if success else _FAILURE_MESSAGE
     
-    await hass.services.async_call(
-        "persistent_notification",
-        "create",
-        {
-            "title": "🚗 Uber Ride Tracker Setup",
-            "message": message,
-            "notification_id": "uber_ride_tracker_setup",
-        },
-        blocking=False
+    persistent_notification.async_create(
+        hass,
+        message,
+        title="🚗 Uber Ride Tracker Setup",
+        notification_id="uber_ride_tracker_setup",
     )
\ No newline at end of file
@@ -1,8 +1,10 @@
 """Simplified config flow for Uber Ride Tracker integration."""
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Final, Optional
 import voluptuous as vol
 import aiohttp
+from yarl import URL
 from urllib.parse import urlencode, parse_qs, urlparse
 
 from homeassistant import config_entries
@@ -10,32 +12,110 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.components import persistent_notification
+from homeassistant.util.json import json_loads
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    TextSelector,
+    TextSelectorConfig,
+    TextSelectorType,
+)
 
+from .card_setup import copy_card_to_www
 from .const import (
+    API_BASE_URL,
+    AUTH_TYPE_OAUTH,
+    AUTH_TYPE_PERSONAL_TOKEN,
     CONF_CLIENT_ID,
     CONF_CLIENT_SECRET,
+    DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    ENDPOINT_CURRENT_REQUEST,
+    ENDPOINT_TRIP_HISTORY,
+    ENDPOINT_USER_PROFILE,
     NAME,
+    OAUTH2_TOKEN_URL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Endpoints are parsed once here and handed to aiohttp as ready URL objects
+URL_TOKEN: Final = URL(OAUTH2_TOKEN_URL)
+URL_USER_PROFILE: Final = URL(API_BASE_URL + ENDPOINT_USER_PROFILE)
+URL_TRIP_HISTORY: Final = URL(API_BASE_URL + ENDPOINT_TRIP_HISTORY)
+URL_CURRENT_REQUEST: Final = URL(API_BASE_URL + ENDPOINT_CURRENT_REQUEST)
+
+_PASSWORD_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD))
+
 STEP_USER_DATA_SCHEMA = vol.Schema({
-    vol.Required(CONF_CLIENT_ID): str,
-    vol.Required(CONF_CLIENT_SECRET): str,
+    vol.Required(CONF_CLIENT_ID): TextSelector(),
+    vol.Required(CONF_CLIENT_SECRET): _PASSWORD_SELECTOR,
 })
 
 STEP_AUTH_METHOD_SCHEMA = vol.Schema({
-    vol.Required("auth_method", default="oauth"): vol.In({
-        "oauth": "OAuth (Requires Uber Approval)",
-        "personal_token": "Personal Access Token (For Personal Use)"
-    })
+    vol.Required("auth_method", default=AUTH_TYPE_OAUTH): SelectSelector(
+        SelectSelectorConfig(
+            options=[AUTH_TYPE_OAUTH, AUTH_TYPE_PERSONAL_TOKEN],
+            translation_key="auth_method",
+        )
+    )
 })
 
 STEP_PERSONAL_TOKEN_SCHEMA = vol.Schema({
-    vol.Required("personal_access_token"): str,
+    vol.Required("personal_access_token"): _PASSWORD_SELECTOR,
+})
+
+STEP_AUTH_CODE_SCHEMA = vol.Schema({
+    vol.Required("auth_code"): str,
+})
+
+STEP_CONFIRM_SCHEMA = vol.Schema({})
+
+OPTIONS_SCHEMA = vol.Schema({
+    vol.Optional("update_interval", default=DEFAULT_UPDATE_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=10, max=300)
+    ),
+    vol.Optional("show_inactive", default=False): bool,
 })
 
+# Seconds a personal token test result is reused within a flow
+TOKEN_RESULT_TTL = 60
+
+# Static form placeholders, shared by every render
+_USER_PLACEHOLDERS = {
+    "docs_url": "https://github.com/erbarraud/ha-uber-ride-tracker/blob/main/PERSONAL_TOKEN_SETUP.md"
+}
+
+_PERSONAL_TOKEN_PLACEHOLDERS = {
+    "instructions": """Generate a token from your Uber Dashboard:
+1. Go to https://developer.uber.com/dashboard
+2. Select your app → Auth tab
+3. Find 'Test with a Personal Access Token'
+4. Select scopes (profile, history, etc.)
+5. Click 'Generate a new token'
+6. Copy and paste it here"""
+}
+
+_OAUTH_PLACEHOLDERS = {
+    "dashboard_url": "https://developer.uber.com/dashboard",
+}
+
+_AUTH_NOTIFICATION_TMPL = """
+## 🔐 Uber Authorization Required
+
+Please authorize the Uber integration:
+
+1. **[Click here to authorize with Uber]({auth_url})**
+2. Log in with your Uber account
+3. Authorize the app
+4. Copy the authorization code from the callback page
+5. Paste it in the form below
+
+**Redirect URI configured:** `{redirect_uri}`
+
+Make sure this URI is added to your Uber app settings.
+        """
+
 class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Uber Ride Tracker."""
 
@@ -50,13 +130,18 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.auth_code = None
         self.redirect_uri = None
         self.test_results = {}
+        # Authorization URL and the (client_id, redirect_uri) it was built for
+        self._auth_url: Optional[str] = None
+        self._auth_url_key: Optional[tuple] = None
+        # Personal token -> (loop time, definitive test result)
+        self._token_results: Dict[str, tuple[float, Dict[str, Any]]] = {}
 
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle the initial step - choose authentication method."""
         if user_input is not None:
-            if user_input["auth_method"] == "personal_token":
+            if user_input["auth_method"] == AUTH_TYPE_PERSONAL_TOKEN:
                 return await self.async_step_personal_token()
             else:
                 return await self.async_step_oauth()
@@ -64,9 +149,7 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user",
             data_schema=STEP_AUTH_METHOD_SCHEMA,
-            description_placeholders={
-                "docs_url": "https://github.com/erbarraud/ha-uber-ride-tracker/blob/main/PERSONAL_TOKEN_SETUP.md"
-            }
+            description_placeholders=_USER_PLACEHOLDERS,
         )
     
     async def async_step_personal_token(
@@ -78,15 +161,23 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             token = user_input["personal_access_token"].strip()
             
-            # Test the token
-            test_result = await self._test_personal_token(token)
+            # Test the token, reusing a recent definitive result on resubmit
+            now = self.hass.loop.time()
+            cached = self._token_results.get(token)
+            if cached and now - cached[0] < TOKEN_RESULT_TTL:
+                test_result = cached[1]
+            else:
+                test_result = await self._test_personal_token(token)
+                # Transient failures are not cached so a retry hits the API
+                if test_result["success"] or test_result["error"] == "invalid_token":
+                    self._token_results[token] = (now, test_result)
             
             if test_result["success"]:
                 # Create the config entry
                 return self.async_create_entry(
                     title=f"Uber (Personal: {test_result.get('user_name', 'Unknown')})",
                     data={
-                        "auth_type": "personal_token",
+                        "auth_type": AUTH_TYPE_PERSONAL_TOKEN,
                         "personal_access_token": token,
                         "user_info": test_result.get("user_info", {})
                     }
@@ -98,15 +189,7 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="personal_token",
             data_schema=STEP_PERSONAL_TOKEN_SCHEMA,
             errors=errors,
-            description_placeholders={
-                "instructions": """Generate a token from your Uber Dashboard:
-1. Go to https://developer.uber.com/dashboard
-2. Select your app → Auth tab
-3. Find 'Test with a Personal Access Token'
-4. Select scopes (profile, history, etc.)
-5. Click 'Generate a new token'
-6. Copy and paste it here"""
-            }
+            description_placeholders=_PERSONAL_TOKEN_PLACEHOLDERS,
         )
     
     async def async_step_oauth(
@@ -122,6 +205,10 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.client_id = user_input[CONF_CLIENT_ID].strip()
             self.client_secret = user_input[CONF_CLIENT_SECRET].strip()
             
+            # Set unique ID to prevent duplicates before doing any validation
+            await self.async_set_unique_id(f"uber_{self.client_id}")
+            self._abort_if_unique_id_configured()
+            
             # Basic validation
             _LOGGER.debug("Validating credentials format")
             if len(self.client_id) < 20:
@@ -131,10 +218,6 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error("Client secret too short: %d chars", len(self.client_secret))
                 errors["base"] = "invalid_client_secret"
             else:
-                # Set unique ID to prevent duplicates
-                await self.async_set_unique_id(f"uber_{self.client_id}")
-                self._abort_if_unique_id_configured()
-                
                 # Move to OAuth authorization
                 return await self.async_step_oauth_auth()
 
@@ -143,9 +226,7 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="oauth",
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
-            description_placeholders={
-                "dashboard_url": "https://developer.uber.com/dashboard",
-            },
+            description_placeholders=_OAUTH_PLACEHOLDERS,
         )
 
     async def async_step_oauth_auth(
@@ -154,15 +235,16 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle OAuth authorization."""
         _LOGGER.info("Starting OAuth authorization step")
         
-        # Generate redirect URI based on HA instance
-        if self.hass.config.external_url:
-            base_url = str(self.hass.config.external_url).rstrip('/')
-            self.redirect_uri = f"{base_url}/local/uber_callback.html"
-        else:
-            # Fallback
-            self.redirect_uri = "https://home.erbarraud.com/local/uber_callback.html"
-        
-        _LOGGER.info("Using redirect URI: %s", self.redirect_uri)
+        # Generate redirect URI based on HA instance once; retries reuse it
+        if self.redirect_uri is None:
+            if self.hass.config.external_url:
+                base_url = str(self.hass.config.external_url).rstrip('/')
+                self.redirect_uri = f"{base_url}/local/uber_callback.html"
+            else:
+                # Fallback
+                self.redirect_uri = "https://home.erbarraud.com/local/uber_callback.html"
+            
+            _LOGGER.info("Using redirect URI: %s", self.redirect_uri)
         
         if user_input is not None:
             # User provided auth code
@@ -178,9 +260,7 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error("Token exchange failed")
                 return self.async_show_form(
                     step_id="oauth",
-                    data_schema=vol.Schema({
-                        vol.Required("auth_code"): str,
-                    }),
+                    data_schema=STEP_AUTH_CODE_SCHEMA,
                     errors={"base": "auth_failed"},
                     description_placeholders={
                         "auth_url": self._generate_auth_url(),
@@ -193,13 +273,11 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         _LOGGER.info("Showing OAuth form with auth URL")
         
         # Also create a notification with clickable link
-        await self._create_auth_notification(auth_url)
+        self._create_auth_notification(auth_url)
         
         return self.async_show_form(
             step_id="oauth",
-            data_schema=vol.Schema({
-                vol.Required("auth_code"): str,
-            }),
+            data_schema=STEP_AUTH_CODE_SCHEMA,
             description_placeholders={
                 "auth_url": auth_url,
                 "redirect_uri": self.redirect_uri,
@@ -236,7 +314,7 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Show test results and allow retry
             return self.async_show_form(
                 step_id="test",
-                data_schema=vol.Schema({}),
+                data_schema=STEP_CONFIRM_SCHEMA,
                 errors={"base": "tests_failed"},
                 description_placeholders={
                     "test_results": self._format_test_results(),
@@ -246,41 +324,31 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_complete(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
-        """Complete setup and install card."""
-        _LOGGER.info("Completing setup")
+        """Complete setup and install card once the tests have passed."""
+        _LOGGER.info("Creating config entry")
         
-        if user_input is not None:
-            # User clicked complete
-            _LOGGER.info("Creating config entry")
-            
-            # Store tokens in data
-            data = {
-                CONF_CLIENT_ID: self.client_id,
-                CONF_CLIENT_SECRET: self.client_secret,
-                "access_token": self.access_token,
-                "refresh_token": self.refresh_token,
-            }
-            
-            # Setup card
-            await self._setup_card()
-            
-            return self.async_create_entry(
-                title=NAME,
-                data=data,
-            )
+        # Store tokens in data
+        data = {
+            CONF_CLIENT_ID: self.client_id,
+            CONF_CLIENT_SECRET: self.client_secret,
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+        }
         
-        # Show completion form with card setup button
-        return self.async_show_form(
-            step_id="complete",
-            data_schema=vol.Schema({}),
-            description_placeholders={
-                "test_results": self._format_test_results(),
-                "card_info": "Click 'Submit' to complete setup and install the Lovelace card.",
-            },
+        # Setup card
+        await self._setup_card()
+        
+        return self.async_create_entry(
+            title=NAME,
+            data=data,
         )
 
     def _generate_auth_url(self) -> str:
         """Generate OAuth authorization URL."""
+        key = (self.client_id, self.redirect_uri)
+        if self._auth_url is not None and self._auth_url_key == key:
+            return self._auth_url
+        
         # Use the correct auth.uber.com domain (not login.uber.com)
         params = {
             "client_id": self.client_id,
@@ -294,6 +362,8 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         auth_url = f"https://auth.uber.com/oauth/v2/authorize?{urlencode(params)}"
         _LOGGER.info("OAuth URL params: %s", params)
         _LOGGER.info("Full OAuth URL: %s", auth_url)
+        self._auth_url = auth_url
+        self._auth_url_key = key
         return auth_url
 
     async def _exchange_auth_code(self) -> bool:
@@ -312,12 +382,12 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         try:
             # Use correct auth.uber.com domain for token endpoint
             async with session.post(
-                "https://auth.uber.com/oauth/v2/token",
+                URL_TOKEN,
                 data=data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"}
             ) as response:
                 if response.status == 200:
-                    token_data = await response.json()
+                    token_data = json_loads(await response.read())
                     self.access_token = token_data.get("access_token")
                     self.refresh_token = token_data.get("refresh_token")
                     _LOGGER.info("Successfully obtained access token")
@@ -349,16 +419,33 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             "error": None if self.access_token else "No access token"
         }
         
-        # Test 2: Profile access
+        # Tests 2-4 are independent, so probe the endpoints concurrently
+        (
+            results["profile_access"],
+            results["history_access"],
+            results["current_ride"],
+        ) = await asyncio.gather(
+            self._probe_profile(session, headers),
+            self._probe_history(session, headers),
+            self._probe_current_ride(session, headers),
+        )
+        
+        return results
+
+    async def _probe_profile(
+        self, session: aiohttp.ClientSession, headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Test profile access."""
         try:
             _LOGGER.debug("Testing profile endpoint")
             async with session.get(
-                "https://api.uber.com/v1.2/me",
+                URL_USER_PROFILE,
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    results["profile_access"] = {
+                    data = json_loads(await response.read())
+                    _LOGGER.info("Profile access successful: %s", data.get("email"))
+                    return {
                         "name": "Profile Access",
                         "success": True,
                         "data": {
@@ -366,87 +453,89 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             "email": data.get("email", "N/A")
                         }
                     }
-                    _LOGGER.info("Profile access successful: %s", data.get("email"))
                 else:
                     error = await response.text()
-                    results["profile_access"] = {
+                    _LOGGER.error("Profile access failed: %s", error)
+                    return {
                         "name": "Profile Access",
                         "success": False,
                         "error": f"HTTP {response.status}: {error[:100]}"
                     }
-                    _LOGGER.error("Profile access failed: %s", error)
         except Exception as e:
-            results["profile_access"] = {
+            _LOGGER.error("Profile test exception: %s", e)
+            return {
                 "name": "Profile Access",
                 "success": False,
                 "error": str(e)
             }
-            _LOGGER.error("Profile test exception: %s", e)
-        
-        # Test 3: History access
+
+    async def _probe_history(
+        self, session: aiohttp.ClientSession, headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Test ride history access."""
         try:
             _LOGGER.debug("Testing history endpoint")
             async with session.get(
-                "https://api.uber.com/v1.2/history",
+                URL_TRIP_HISTORY,
                 headers=headers,
                 params={"limit": 1}
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    results["history_access"] = {
+                    data = json_loads(await response.read())
+                    _LOGGER.info("History access successful: %d rides", data.get("count", 0))
+                    return {
                         "name": "History Access",
                         "success": True,
                         "data": {"ride_count": data.get("count", 0)}
                     }
-                    _LOGGER.info("History access successful: %d rides", data.get("count", 0))
                 else:
                     error = await response.text()
-                    results["history_access"] = {
+                    _LOGGER.error("History access failed: %s", error)
+                    return {
                         "name": "History Access",
                         "success": False,
                         "error": f"HTTP {response.status}: {error[:100]}"
                     }
-                    _LOGGER.error("History access failed: %s", error)
         except Exception as e:
-            results["history_access"] = {
+            _LOGGER.error("History test exception: %s", e)
+            return {
                 "name": "History Access",
                 "success": False,
                 "error": str(e)
             }
-            _LOGGER.error("History test exception: %s", e)
-        
-        # Test 4: Current ride (optional, might fail)
+
+    async def _probe_current_ride(
+        self, session: aiohttp.ClientSession, headers: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Test current ride access (optional, might fail)."""
         try:
             _LOGGER.debug("Testing current ride endpoint")
             async with session.get(
-                "https://api.uber.com/v1.2/requests/current",
+                URL_CURRENT_REQUEST,
                 headers=headers
             ) as response:
                 if response.status in [200, 404]:
-                    results["current_ride"] = {
+                    _LOGGER.info("Current ride access successful: %s", 
+                                "active ride" if response.status == 200 else "no active ride")
+                    return {
                         "name": "Current Ride Access",
                         "success": True,
                         "data": {"has_active": response.status == 200}
                     }
-                    _LOGGER.info("Current ride access successful: %s", 
-                                "active ride" if response.status == 200 else "no active ride")
                 else:
-                    error = await response.text()
-                    results["current_ride"] = {
+                    _LOGGER.warning("Current ride access requires privileged scope")
+                    return {
                         "name": "Current Ride Access",
                         "success": False,
-                        "error": f"Requires 'request' scope (privileged)"
+                        "error": "Requires 'request' scope (privileged)"
                     }
-                    _LOGGER.warning("Current ride access requires privileged scope")
         except Exception as e:
-            results["current_ride"] = {
+            _LOGGER.error("Current ride test exception: %s", e)
+            return {
                 "name": "Current Ride Access",
                 "success": False,
                 "error": str(e)
             }
-            _LOGGER.error("Current ride test exception: %s", e)
-        
-        return results
 
     async def _test_personal_token(self, token: str) -> Dict[str, Any]:
         """Test a personal access token."""
@@ -461,11 +550,11 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Test the token by getting user profile
         try:
             async with session.get(
-                "https://api.uber.com/v1.2/me",
+                URL_USER_PROFILE,
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    user_data = await response.json()
+                    user_data = json_loads(await response.read())
                     _LOGGER.info("Personal token valid for user: %s", user_data.get("email"))
                     return {
                         "success": True,
@@ -514,92 +603,37 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         
         return "\n".join(lines)
 
-    async def _create_auth_notification(self, auth_url: str):
+    @callback
+    def _create_auth_notification(self, auth_url: str) -> None:
         """Create a persistent notification with auth URL."""
         _LOGGER.info("Creating auth notification")
         
-        message = f"""
-## 🔐 Uber Authorization Required
-
-Please authorize the Uber integration:
-
-1. **[Click here to authorize with Uber]({auth_url})**
-2. Log in with your Uber account
-3. Authorize the app
-4. Copy the authorization code from the callback page
-5. Paste it in the form below
-
-**Redirect URI configured:** `{self.redirect_uri}`
-
-Make sure this URI is added to your Uber app settings.
-        """
+        message = _AUTH_NOTIFICATION_TMPL.format(
+            auth_url=auth_url, redirect_uri=self.redirect_uri
+        )
         
-        await self.hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "Uber Integration Setup",
-                "message": message,
-                "notification_id": "uber_setup_auth",
-            },
+        persistent_notification.async_create(
+            self.hass,
+            message,
+            title="Uber Integration Setup",
+            notification_id="uber_setup_auth",
         )
 
     async def _setup_card(self):
         """Setup the Lovelace card."""
         _LOGGER.info("Setting up Lovelace card")
-        
-        try:
-            from pathlib import Path
-            import shutil
-            
-            # Get paths
-            www_path = Path(self.hass.config.path("www"))
-            integration_dir = Path(__file__).parent
-            
-            # Create www directory if it doesn't exist
-            if not www_path.exists():
-                www_path.mkdir(mode=0o755, parents=True, exist_ok=True)
-                _LOGGER.info("Created www directory at: %s", www_path)
-            
-            # Copy card file
-            card_source = integration_dir / "www" / "uber-ride-tracker-card.js"
-            card_dest = www_path / "uber-ride-tracker-card.js"
-            
-            if card_source.exists():
-                shutil.copy2(str(card_source), str(card_dest))
-                card_dest.chmod(0o644)
-                _LOGGER.info("Card file copied to: %s", card_dest)
-            else:
-                _LOGGER.error("Card source file not found: %s", card_source)
-            
-            # Copy callback HTML
-            callback_source = integration_dir / "www" / "uber_callback.html"
-            callback_dest = www_path / "uber_callback.html"
-            
-            if callback_source.exists():
-                shutil.copy2(str(callback_source), str(callback_dest))
-                callback_dest.chmod(0o644)
-                _LOGGER.info("Callback page copied to: %s", callback_dest)
-            else:
-                _LOGGER.error("Callback source file not found: %s", callback_source)
-                
-        except Exception as e:
-            _LOGGER.error("Error setting up card: %s", e)
+        await copy_card_to_www(self.hass)
 
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
         """Get the options flow for this handler."""
-        return UberRideTrackerOptionsFlow(config_entry)
+        return UberRideTrackerOptionsFlow()
 
 
 class UberRideTrackerOptionsFlow(config_entries.OptionsFlow):
     """Handle options for Uber Ride Tracker."""
 
-    def __init__(self, config_entry):
-        """Initialize options flow."""
-        self.config_entry = config_entry
-
     async def async_step_init(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
@@ -609,14 +643,7 @@ class UberRideTrackerOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Optional(
-                    "update_interval",
-                    default=self.config_entry.options.get("update_interval", 60)
-                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
-                vol.Optional(
-                    "show_inactive",
-                    default=self.config_entry.options.get("show_inactive", False)
-                ): bool,
-            }),
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
         )
\ No newline at end of file
@@ -5,7 +5,12 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.data_entry_flow import AbortFlow, FlowResult
+from homeassistant.helpers.selector import (
+    TextSelector,
+    TextSelectorConfig,
+    TextSelectorType,
+)
 
 from .const import (
     CONF_CLIENT_ID,
@@ -17,8 +22,17 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 STEP_USER_DATA_SCHEMA = vol.Schema({
-    vol.Required(CONF_CLIENT_ID): str,  # Shows as "Application ID" in UI via translations
-    vol.Required(CONF_CLIENT_SECRET): str,  # Shows as "Secret" in UI via translations
+    vol.Required(CONF_CLIENT_ID): TextSelector(),  # Shows as "Application ID" in UI via translations
+    vol.Required(CONF_CLIENT_SECRET): TextSelector(  # Shows as "Secret" in UI via translations
+        TextSelectorConfig(type=TextSelectorType.PASSWORD)
+    ),
+})
+
+OPTIONS_SCHEMA = vol.Schema({
+    vol.Optional("update_interval", default=60): vol.All(
+        vol.Coerce(int), vol.Range(min=10, max=300)
+    ),
+    vol.Optional("show_inactive", default=False): bool,
 })
 
 
@@ -34,10 +48,20 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: Dict[str, str] = {}
 
         if user_input is not None:
+            # Normalize the credentials
+            client_id = user_input[CONF_CLIENT_ID].strip()
+            client_secret = user_input[CONF_CLIENT_SECRET].strip()
+            
             try:
-                # Validate the credentials format
-                client_id = user_input[CONF_CLIENT_ID].strip()
-                client_secret = user_input[CONF_CLIENT_SECRET].strip()
+                # Set unique ID to prevent duplicate entries before validating
+                await self.async_set_unique_id(f"uber_{client_id}")
+            except AbortFlow:
+                raise
+            except Exception as err:
+                _LOGGER.error("Unexpected error: %s", err)
+                errors["base"] = "unknown"
+            else:
+                self._abort_if_unique_id_configured()
                 
                 # Basic validation - Uber Application IDs are typically 22+ characters
                 if len(client_id) < 20:
@@ -45,10 +69,6 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 elif len(client_secret) < 20:
                     errors["base"] = "invalid_client_secret"
                 else:
-                    # Set unique ID to prevent duplicate entries
-                    await self.async_set_unique_id(f"uber_{client_id}")
-                    self._abort_if_unique_id_configured()
-                    
                     # Create the config entry
                     return self.async_create_entry(
                         title=NAME,
@@ -57,9 +77,6 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             CONF_CLIENT_SECRET: client_secret,
                         },
                     )
-            except Exception as err:
-                _LOGGER.error("Unexpected error: %s", err)
-                errors["base"] = "unknown"
 
         # Get the external URL for the redirect URI
         redirect_uri = "https://my.home-assistant.io/redirect/oauth"
@@ -81,16 +98,12 @@ class UberRideTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     @callback
     def async_get_options_flow(config_entry):
         """Get the options flow for this handler."""
-        return UberRideTrackerOptionsFlow(config_entry)
+        return UberRideTrackerOptionsFlow()
 
 
 class UberRideTrackerOptionsFlow(config_entries.OptionsFlow):
     """Handle options for Uber Ride Tracker."""
 
-    def __init__(self, config_entry):
-        """Initialize options flow."""
-        self.config_entry = config_entry
-
     async def async_step_init(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
@@ -100,14 +113,7 @@ class UberRideTrackerOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Optional(
-                    "update_interval",
-                    default=self.config_entry.options.get("update_interval", 60)
-                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
-                vol.Optional(
-                    "show_inactive",
-                    default=self.config_entry.options.get("show_inactive", False)
-                ): bool,
-            }),
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
         )
\ No newline at end of file
@@ -43,12 +43,12 @@ RIDE_STATUS_DRIVER_CANCELED: Final = "driver_canceled"
 RIDE_STATUS_RIDER_CANCELED: Final = "rider_canceled"
 RIDE_STATUS_COMPLETED: Final = "completed"
 
-ACTIVE_RIDE_STATUSES: Final = [
+ACTIVE_RIDE_STATUSES: Final = frozenset({
     RIDE_STATUS_PROCESSING,
     RIDE_STATUS_ACCEPTED,
     RIDE_STATUS_ARRIVING,
     RIDE_STATUS_IN_PROGRESS,
-]
+})
 
 # Entity Keys
 CONF_CLIENT_ID: Final = "client_id"  # Internally we still use client_id for OAuth compatibility
@@ -59,6 +59,10 @@ CONF_ACCESS_TOKEN: Final = "access_token"
 CONF_REFRESH_TOKEN: Final = "refresh_token"
 CONF_TOKEN_EXPIRES: Final = "token_expires"
 
+# Authentication methods, stored in the entry data as "auth_type"
+AUTH_TYPE_OAUTH: Final = "oauth"
+AUTH_TYPE_PERSONAL_TOKEN: Final = "personal_token"
+
 # Attributes
 ATTR_STATUS: Final = "status"
 ATTR_DRIVER_NAME: Final = "driver_name"
@@ -92,10 +96,13 @@ SERVICE_GET_RIDE_HISTORY: Final = "get_ride_history"
 # Defaults
 DEFAULT_NAME: Final = "Uber Ride"
 DEFAULT_SCAN_INTERVAL: Final = UPDATE_INTERVAL_INACTIVE
+# Current-ride poll interval in seconds when the options don't set one
+DEFAULT_UPDATE_INTERVAL: Final = 30
 
 # Rate Limiting
 RATE_LIMIT_CALLS: Final = 2000
 RATE_LIMIT_WINDOW: Final = 3600  # 1 hour in seconds
+RATE_LIMIT_MAX_WAIT: Final = 5  # Seconds a request may wait for quota
 
 # Error Messages
 ERROR_AUTH_FAILED: Final = "authentication_failed"
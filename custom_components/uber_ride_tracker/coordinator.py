@@ -1,12 +1,13 @@
 """DataUpdateCoordinator for Uber Ride Tracker."""
 import logging
-from datetime import timedelta
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import UberAPI, UberAPIError, UberNoActiveRideError
+from .api import ParsedRide, UberAPI, UberAPIError, UberNoActiveRideError
 from .const import (
     ACTIVE_RIDE_STATUSES,
     DOMAIN,
@@ -33,12 +34,16 @@ class UberRideCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         self._last_status: Optional[str] = None
         self._error_count = 0
         self._max_error_count = 3
+        # Kept out of data so an unchanged poll compares equal to the last one
+        self.last_update: Optional[datetime] = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{entry_id}",
             update_interval=UPDATE_INTERVAL_INACTIVE,
+            # Only notify entities when the ride data actually changed
+            always_update=False,
         )
 
     async def _async_update_data(self) -> Dict[str, Any]:
@@ -53,7 +58,7 @@ class UberRideCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             if ride_data:
                 # Parse the ride data
                 parsed_data = self.api.parse_ride_data(ride_data)
-                current_status = parsed_data.get("status")
+                current_status = parsed_data.status
 
                 # Log status changes
                 if current_status != self._last_status:
@@ -74,12 +79,12 @@ class UberRideCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
 
                 # Get additional details if ride is active
                 if current_status in ACTIVE_RIDE_STATUSES:
-                    request_id = parsed_data.get("request_id")
+                    request_id = parsed_data.request_id
                     if request_id:
                         try:
                             # Get receipt/fare information
                             receipt_data = await self.api.async_get_ride_receipt(request_id)
-                            parsed_data["receipt"] = receipt_data
+                            parsed_data.receipt = receipt_data
                         except UberAPIError:
                             # Receipt might not be available for ongoing rides
                             _LOGGER.debug("Receipt not available for current ride")
@@ -87,14 +92,14 @@ class UberRideCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                         try:
                             # Get map data
                             map_data = await self.api.async_get_ride_map(request_id)
-                            parsed_data["map"] = map_data
+                            parsed_data.map = map_data
                         except UberAPIError:
                             _LOGGER.debug("Map data not available for current ride")
 
+                self.last_update = dt_util.now()
                 return {
                     "ride": parsed_data,
                     "has_active_ride": True,
-                    "last_update": self.hass.helpers.template.now(),
                 }
 
             else:
@@ -102,10 +107,10 @@ class UberRideCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 self._last_status = None
                 self.update_interval = UPDATE_INTERVAL_INACTIVE
                 
+                self.last_update = dt_util.now()
                 return {
                     "ride": None,
                     "has_active_ride": False,
-                    "last_update": self.hass.helpers.template.now(),
                 }
 
         except UberNoActiveRideError:
@@ -113,10 +118,10 @@ class UberRideCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             self._last_status = None
             self.update_interval = UPDATE_INTERVAL_INACTIVE
             
+            self.last_update = dt_util.now()
             return {
                 "ride": None,
                 "has_active_ride": False,
-                "last_update": self.hass.helpers.template.now(),
             }
 
         except UberAPIError as err:
@@ -157,78 +162,73 @@ class UberRideCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         if not self.data or not self.data.get("has_active_ride"):
             return {}
 
-        ride = self.data.get("ride", {})
+        ride: ParsedRide = self.data.get("ride")
         if not ride:
             return {}
 
         attributes = {
-            "status": ride.get("status"),
-            "trip_id": ride.get("request_id"),
-            "product_id": ride.get("product_id"),
-            "surge_multiplier": ride.get("surge_multiplier", 1.0),
-            "shared": ride.get("shared", False),
-            "last_update": self.data.get("last_update"),
+            "status": ride.status,
+            "trip_id": ride.request_id,
+            "product_id": ride.product_id,
+            "surge_multiplier": ride.surge_multiplier,
+            "shared": ride.shared,
+            "last_update": self.last_update,
         }
 
         # Driver information
-        driver = ride.get("driver", {})
-        if driver.get("name"):
+        if ride.driver_name:
             attributes.update({
-                "driver_name": driver.get("name"),
-                "driver_rating": driver.get("rating"),
-                "driver_phone": driver.get("phone_number"),
-                "driver_photo_url": driver.get("picture_url"),
+                "driver_name": ride.driver_name,
+                "driver_rating": ride.driver_rating,
+                "driver_phone": ride.driver_phone_number,
+                "driver_photo_url": ride.driver_picture_url,
             })
 
         # Vehicle information
-        vehicle = ride.get("vehicle", {})
-        if vehicle.get("make"):
+        if ride.vehicle_make:
             attributes.update({
-                "vehicle_make": vehicle.get("make"),
-                "vehicle_model": vehicle.get("model"),
-                "vehicle_color": vehicle.get("color"),
-                "vehicle_license_plate": vehicle.get("license_plate"),
-                "vehicle_picture_url": vehicle.get("picture_url"),
+                "vehicle_make": ride.vehicle_make,
+                "vehicle_model": ride.vehicle_model,
+                "vehicle_color": ride.vehicle_color,
+                "vehicle_license_plate": ride.vehicle_license_plate,
+                "vehicle_picture_url": ride.vehicle_picture_url,
             })
 
         # Location information
-        pickup = ride.get("pickup", {})
-        if pickup.get("address"):
+        if ride.pickup_address:
             attributes.update({
-                "pickup_address": pickup.get("address"),
-                "pickup_eta": pickup.get("eta"),
-                "pickup_latitude": pickup.get("latitude"),
-                "pickup_longitude": pickup.get("longitude"),
+                "pickup_address": ride.pickup_address,
+                "pickup_eta": ride.pickup_eta,
+                "pickup_latitude": ride.pickup_latitude,
+                "pickup_longitude": ride.pickup_longitude,
             })
 
-        destination = ride.get("destination", {})
-        if destination.get("address"):
+        if ride.destination_address:
             attributes.update({
-                "destination_address": destination.get("address"),
-                "destination_eta": destination.get("eta"),
-                "destination_latitude": destination.get("latitude"),
-                "destination_longitude": destination.get("longitude"),
+                "destination_address": ride.destination_address,
+                "destination_eta": ride.destination_eta,
+                "destination_latitude": ride.destination_latitude,
+                "destination_longitude": ride.destination_longitude,
             })
 
         # Current location
-        location = ride.get("location", {})
-        if location.get("latitude"):
+        if ride.driver_latitude:
             attributes.update({
-                "driver_latitude": location.get("latitude"),
-                "driver_longitude": location.get("longitude"),
-                "driver_bearing": location.get("bearing"),
+                "driver_latitude": ride.driver_latitude,
+                "driver_longitude": ride.driver_longitude,
+                "driver_bearing": ride.driver_bearing,
             })
 
         # Fare information
-        if ride.get("fare"):
-            attributes["fare_estimate"] = ride.get("fare")
+        if ride.fare:
+            attributes["fare_estimate"] = ride.fare
 
         # Progress
-        attributes["trip_progress_percentage"] = ride.get("progress_percentage", 0)
+        attributes["trip_progress_percentage"] = ride.progress_percentage
 
         # Map URL (construct from ride ID)
-        if ride.get("request_id"):
-            attributes["map_url"] = f"https://riders.uber.com/trips/{ride['request_id']}"
-            attributes["share_url"] = f"https://riders.uber.com/share/{ride['request_id']}"
+        if ride.request_id:
+            attributes["map_url"] = f"https://riders.uber.com/trips/{ride.request_id}"
+            attributes["share_url"] = f"https://riders.uber.com/share/{ride.request_id}"
 
-        return attributes
\ No newline at end of file
+        return attributes
@@ -0,0 +1,63 @@
+"""Current-ride DataUpdateCoordinator for Uber Ride Tracker."""
+import logging
+import random
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .api_client import UberAPIClient
+from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+CURRENT_RIDE_SCAN_INTERVAL = timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
+# Spread polling of multiple entries so they don't all wake up together
+CURRENT_RIDE_SCAN_JITTER = 5
+
+
+class UberCurrentRideCoordinator(DataUpdateCoordinator[Optional[Dict[str, Any]]]):
+    """Fetch the current ride once per interval for all entities of an entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_client: UberAPIClient,
+        entry_id: str,
+        scan_interval: timedelta = CURRENT_RIDE_SCAN_INTERVAL,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.api_client = api_client
+        self.entry_id = entry_id
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{entry_id}_current_ride",
+            update_interval=scan_interval
+            + timedelta(seconds=random.uniform(0, CURRENT_RIDE_SCAN_JITTER)),
+            always_update=False,
+        )
+
+    async def _async_update_data(self) -> Optional[Dict[str, Any]]:
+        """Fetch the current ride from the Uber API."""
+        ride_data = await self.api_client.get_current_ride()
+
+        if not ride_data:
+            # Keep the last known snapshot when the API gives us nothing
+            _LOGGER.debug("No data from API")
+            return self.data
+
+        if ride_data.get("has_ride"):
+            status = ride_data.get("status")
+            previous = self.data.get("status") if self.data else None
+            # Log ride transitions at info, not every poll of the same ride
+            if status != previous:
+                _LOGGER.info("Active ride found: %s", status)
+            else:
+                _LOGGER.debug("Active ride still %s", status)
+        else:
+            _LOGGER.debug("No active ride")
+
+        return ride_data
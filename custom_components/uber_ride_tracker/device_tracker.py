@@ -10,6 +10,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import ParsedRide
 from .const import (
     ACTIVE_RIDE_STATUSES,
     DOMAIN,
@@ -64,10 +65,7 @@ class UberDriverTracker(CoordinatorEntity, TrackerEntity):
         if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
             return None
         
-        ride = self.coordinator.data.get("ride", {})
-        location = ride.get("location", {})
-        
-        return location.get("latitude")
+        return self.coordinator.data["ride"].driver_latitude
 
     @property
     def longitude(self) -> Optional[float]:
@@ -75,10 +73,7 @@ class UberDriverTracker(CoordinatorEntity, TrackerEntity):
         if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
             return None
         
-        ride = self.coordinator.data.get("ride", {})
-        location = ride.get("location", {})
-        
-        return location.get("longitude")
+        return self.coordinator.data["ride"].driver_longitude
 
     @property
     def location_accuracy(self) -> int:
@@ -101,56 +96,50 @@ class UberDriverTracker(CoordinatorEntity, TrackerEntity):
                 "tracking": False,
             }
         
-        ride = self.coordinator.data.get("ride", {})
-        location = ride.get("location", {})
-        driver = ride.get("driver", {})
-        vehicle = ride.get("vehicle", {})
-        status = ride.get("status")
+        ride: ParsedRide = self.coordinator.data["ride"]
+        status = ride.status
         
         attributes = {
             "status": status,
             "tracking": status in ACTIVE_RIDE_STATUSES,
         }
         
-        if location.get("bearing") is not None:
-            attributes["bearing"] = location["bearing"]
+        if ride.driver_bearing is not None:
+            attributes["bearing"] = ride.driver_bearing
         
-        if driver.get("name"):
+        if ride.driver_name:
             attributes.update({
-                "driver_name": driver.get("name"),
-                "driver_rating": driver.get("rating"),
-                "driver_phone": driver.get("phone_number"),
-                "driver_photo_url": driver.get("picture_url"),
+                "driver_name": ride.driver_name,
+                "driver_rating": ride.driver_rating,
+                "driver_phone": ride.driver_phone_number,
+                "driver_photo_url": ride.driver_picture_url,
             })
         
-        if vehicle.get("make"):
+        if ride.vehicle_make:
             attributes.update({
-                "vehicle": f"{vehicle.get('make')} {vehicle.get('model')}",
-                "vehicle_color": vehicle.get("color"),
-                "vehicle_license_plate": vehicle.get("license_plate"),
-                "vehicle_picture_url": vehicle.get("picture_url"),
+                "vehicle": f"{ride.vehicle_make} {ride.vehicle_model}",
+                "vehicle_color": ride.vehicle_color,
+                "vehicle_license_plate": ride.vehicle_license_plate,
+                "vehicle_picture_url": ride.vehicle_picture_url,
             })
         
         # Add pickup and destination info
-        pickup = ride.get("pickup", {})
-        destination = ride.get("destination", {})
-        
-        if pickup.get("address"):
+        if ride.pickup_address:
             attributes.update({
-                "pickup_address": pickup.get("address"),
-                "pickup_latitude": pickup.get("latitude"),
-                "pickup_longitude": pickup.get("longitude"),
+                "pickup_address": ride.pickup_address,
+                "pickup_latitude": ride.pickup_latitude,
+                "pickup_longitude": ride.pickup_longitude,
             })
         
-        if destination.get("address"):
+        if ride.destination_address:
             attributes.update({
-                "destination_address": destination.get("address"),
-                "destination_latitude": destination.get("latitude"),
-                "destination_longitude": destination.get("longitude"),
+                "destination_address": ride.destination_address,
+                "destination_latitude": ride.destination_latitude,
+                "destination_longitude": ride.destination_longitude,
             })
         
         # Add trip progress
-        attributes["trip_progress_percentage"] = ride.get("progress_percentage", 0)
+        attributes["trip_progress_percentage"] = ride.progress_percentage
         
         return attributes
 
@@ -180,8 +169,7 @@ class UberDriverTracker(CoordinatorEntity, TrackerEntity):
         if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
             return "mdi:car-off"
         
-        ride = self.coordinator.data.get("ride", {})
-        status = ride.get("status")
+        status = self.coordinator.data["ride"].status
         
         if status == "arriving":
             return "mdi:car-clock"
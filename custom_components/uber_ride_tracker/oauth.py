@@ -21,6 +21,10 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Don't include scope to avoid invalid_scope error
+# Uber will use default scopes from app configuration
+EXTRA_AUTHORIZE_DATA = {"response_type": "code"}
+
 
 class UberOAuth2Implementation(config_entry_oauth2_flow.AbstractOAuth2Implementation):
     """Uber OAuth2 implementation."""
@@ -97,11 +101,7 @@ class UberOAuth2Implementation(config_entry_oauth2_flow.AbstractOAuth2Implementa
     @property
     def extra_authorize_data(self) -> dict:
         """Extra data to include in authorization URL."""
-        return {
-            # Don't include scope to avoid invalid_scope error
-            # Uber will use default scopes from app configuration
-            "response_type": "code",
-        }
+        return EXTRA_AUTHORIZE_DATA
 
     async def async_generate_authorize_url(self, flow_id: str) -> str:
         """Generate the authorize URL."""
@@ -139,12 +139,24 @@ class UberOAuthManager:
         self._client_secret = client_secret
         self._token_data = token_data
         self._session = async_get_clientsession(hass)
+        # Refresh deadline on the loop's monotonic clock, derived lazily
+        # from the stored ISO timestamp
+        self._refresh_at: Optional[float] = None
+
+    def attach_session(self, session: aiohttp.ClientSession) -> None:
+        """Send token refreshes over the API client's session."""
+        self._session = session
 
     @property
     def access_token(self) -> str:
         """Get the current access token."""
         return self._token_data.get(CONF_ACCESS_TOKEN, "")
 
+    @property
+    def refresh_at(self) -> Optional[float]:
+        """Loop time from which the token counts as expired, once known."""
+        return self._refresh_at
+
     @property
     def refresh_token(self) -> str:
         """Get the refresh token."""
@@ -152,16 +164,20 @@ class UberOAuthManager:
 
     def is_token_expired(self) -> bool:
         """Check if the token is expired."""
-        expires_str = self._token_data.get(CONF_TOKEN_EXPIRES)
-        if not expires_str:
-            return True
-            
-        try:
-            expires = datetime.fromisoformat(expires_str)
+        if self._refresh_at is None:
+            expires_str = self._token_data.get(CONF_TOKEN_EXPIRES)
+            if not expires_str:
+                return True
+
+            try:
+                expires = datetime.fromisoformat(expires_str)
+            except (ValueError, TypeError):
+                return True
             # Consider token expired 5 minutes before actual expiration
-            return datetime.now() >= expires - timedelta(minutes=5)
-        except (ValueError, TypeError):
-            return True
+            remaining = (expires - datetime.now()).total_seconds() - 300
+            self._refresh_at = self.hass.loop.time() + remaining
+
+        return self.hass.loop.time() >= self._refresh_at
 
     async def async_ensure_valid_token(self) -> str:
         """Ensure we have a valid token, refreshing if necessary."""
@@ -199,6 +215,7 @@ class UberOAuthManager:
                 self._token_data[CONF_TOKEN_EXPIRES] = (
                     datetime.now() + timedelta(seconds=expires_in)
                 ).isoformat()
+                self._refresh_at = self.hass.loop.time() + expires_in - 300
                 
                 _LOGGER.debug("Successfully refreshed access token")
                 
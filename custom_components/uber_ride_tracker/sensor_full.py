@@ -9,6 +9,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import ParsedRide
 from .const import (
     ACTIVE_RIDE_STATUSES,
     DOMAIN,
@@ -83,8 +84,7 @@ class UberRideStatusSensor(UberRideTrackerSensorBase):
         if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
             return "no_active_ride"
         
-        ride = self.coordinator.data.get("ride", {})
-        return ride.get("status", "unknown")
+        return self.coordinator.data["ride"].status or "unknown"
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
@@ -97,8 +97,7 @@ class UberRideStatusSensor(UberRideTrackerSensorBase):
         if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
             return "mdi:car-off"
         
-        ride = self.coordinator.data.get("ride", {})
-        status = ride.get("status")
+        status = self.coordinator.data["ride"].status
         
         if status == "processing":
             return "mdi:magnify"
@@ -144,8 +143,7 @@ class UberRideProgressSensor(UberRideTrackerSensorBase):
         if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
             return 0
         
-        ride = self.coordinator.data.get("ride", {})
-        return ride.get("progress_percentage", 0)
+        return self.coordinator.data["ride"].progress_percentage
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
@@ -153,8 +151,8 @@ class UberRideProgressSensor(UberRideTrackerSensorBase):
         if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
             return {}
         
-        ride = self.coordinator.data.get("ride", {})
-        status = ride.get("status")
+        ride: ParsedRide = self.coordinator.data["ride"]
+        status = ride.status
         
         attributes = {
             "status": status,
@@ -162,13 +160,10 @@ class UberRideProgressSensor(UberRideTrackerSensorBase):
         
         # Add ETA information if available
         if status in ACTIVE_RIDE_STATUSES:
-            pickup = ride.get("pickup", {})
-            destination = ride.get("destination", {})
-            
-            if pickup.get("eta"):
-                attributes["pickup_eta"] = pickup["eta"]
-            if destination.get("eta"):
-                attributes["destination_eta"] = destination["eta"]
+            if ride.pickup_eta:
+                attributes["pickup_eta"] = ride.pickup_eta
+            if ride.destination_eta:
+                attributes["destination_eta"] = ride.destination_eta
         
         return attributes
 
@@ -199,11 +194,10 @@ class UberDriverLocationSensor(UberRideTrackerSensorBase):
         if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
             return "unavailable"
         
-        ride = self.coordinator.data.get("ride", {})
-        location = ride.get("location", {})
+        ride: ParsedRide = self.coordinator.data["ride"]
         
-        if location.get("latitude") and location.get("longitude"):
-            return f"{location['latitude']}, {location['longitude']}"
+        if ride.driver_latitude and ride.driver_longitude:
+            return f"{ride.driver_latitude}, {ride.driver_longitude}"
         
         return "unavailable"
 
@@ -213,31 +207,28 @@ class UberDriverLocationSensor(UberRideTrackerSensorBase):
         if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
             return {}
         
-        ride = self.coordinator.data.get("ride", {})
-        location = ride.get("location", {})
-        driver = ride.get("driver", {})
-        vehicle = ride.get("vehicle", {})
+        ride: ParsedRide = self.coordinator.data["ride"]
         
         attributes = {}
         
-        if location.get("latitude"):
+        if ride.driver_latitude:
             attributes.update({
-                "latitude": location.get("latitude"),
-                "longitude": location.get("longitude"),
-                "bearing": location.get("bearing"),
+                "latitude": ride.driver_latitude,
+                "longitude": ride.driver_longitude,
+                "bearing": ride.driver_bearing,
             })
         
-        if driver.get("name"):
+        if ride.driver_name:
             attributes.update({
-                "driver_name": driver.get("name"),
-                "driver_rating": driver.get("rating"),
+                "driver_name": ride.driver_name,
+                "driver_rating": ride.driver_rating,
             })
         
-        if vehicle.get("make"):
+        if ride.vehicle_make:
             attributes.update({
-                "vehicle": f"{vehicle.get('make')} {vehicle.get('model')}",
-                "vehicle_color": vehicle.get("color"),
-                "license_plate": vehicle.get("license_plate"),
+                "vehicle": f"{ride.vehicle_make} {ride.vehicle_model}",
+                "vehicle_color": ride.vehicle_color,
+                "license_plate": ride.vehicle_license_plate,
             })
         
         return attributes
@@ -251,6 +242,5 @@ class UberDriverLocationSensor(UberRideTrackerSensorBase):
         if not self.coordinator.data or not self.coordinator.data.get("has_active_ride"):
             return True  # Available but no data
         
-        ride = self.coordinator.data.get("ride", {})
-        location = ride.get("location", {})
-        return bool(location.get("latitude") and location.get("longitude"))
\ No newline at end of file
+        ride: ParsedRide = self.coordinator.data["ride"]
+        return bool(ride.driver_latitude and ride.driver_longitude)
\ No newline at end of file
@@ -7,6 +7,7 @@ import asyncio
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.components import persistent_notification
 
 from .const import DOMAIN
@@ -17,18 +18,60 @@ UBER_DEVELOPER_SIGNUP = "https://developer.uber.com/signup"
 UBER_DEVELOPER_DASHBOARD = "https://developer.uber.com/dashboard"
 UBER_APP_CREATE = "https://developer.uber.com/dashboard/create"
 
+# The static links are filled in at import; only the redirect URI varies
+_QUICK_SETUP_TMPL = """
+## 🚀 Quick Setup Guide for Uber API
+
+### Step 1: Create Uber Developer Account
+[Click here to sign up]({signup_url})
+
+### Step 2: Create New App
+[Click here to create app]({app_create_url})
+- Name: "Home Assistant Ride Tracker"
+- Product: "Rides API"
+
+### Step 3: Add Redirect URI
+Add this exact URL to your app:
+```
+{redirect_uri}
+```
+
+### Step 4: Get Credentials
+[Open your dashboard]({dashboard_url})
+- Copy your Client ID
+- Copy your Client Secret
+
+### Step 5: Enter in Home Assistant
+Return here and enter your credentials
+
+---
+**Need help?** The redirect URI has been copied to your clipboard!
+        """.format(
+    signup_url=UBER_DEVELOPER_SIGNUP,
+    app_create_url=UBER_APP_CREATE,
+    dashboard_url=UBER_DEVELOPER_DASHBOARD,
+    redirect_uri="{redirect_uri}",
+)
+
 
 class UberAPISetupHelper:
     """Helper class to simplify Uber API setup process."""
 
-    def __init__(self, hass: HomeAssistant):
+    def __init__(
+        self, hass: HomeAssistant, session: Optional[aiohttp.ClientSession] = None
+    ):
         """Initialize the setup helper."""
         self.hass = hass
         self.redirect_uri = None
-        self.session = aiohttp.ClientSession()
+        # Share Home Assistant's pooled session so each helper doesn't pay
+        # for a new connector and TLS handshake
+        self.session = session or async_get_clientsession(hass)
 
     async def get_redirect_uri(self) -> str:
         """Get the correct redirect URI for this Home Assistant instance."""
+        if self.redirect_uri is not None:
+            return self.redirect_uri
+        
         # Try to get the external URL configured in HA
         external_url = self.hass.config.external_url
         internal_url = self.hass.config.internal_url
@@ -137,43 +180,13 @@ class UberAPISetupHelper:
         """Create a persistent notification with setup instructions."""
         redirect_uri = await self.get_redirect_uri()
         
-        message = f"""
-## 🚀 Quick Setup Guide for Uber API
-
-### Step 1: Create Uber Developer Account
-[Click here to sign up]({UBER_DEVELOPER_SIGNUP})
-
-### Step 2: Create New App
-[Click here to create app]({UBER_APP_CREATE})
-- Name: "Home Assistant Ride Tracker"
-- Product: "Rides API"
-
-### Step 3: Add Redirect URI
-Add this exact URL to your app:
-```
-{redirect_uri}
-```
-
-### Step 4: Get Credentials
-[Open your dashboard]({UBER_DEVELOPER_DASHBOARD})
-- Copy your Client ID
-- Copy your Client Secret
-
-### Step 5: Enter in Home Assistant
-Return here and enter your credentials
-
----
-**Need help?** The redirect URI has been copied to your clipboard!
-        """
+        message = _QUICK_SETUP_TMPL.format(redirect_uri=redirect_uri)
         
-        await self.hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "🚗 Uber Ride Tracker - API Setup Guide",
-                "message": message,
-                "notification_id": f"{DOMAIN}_setup_guide",
-            }
+        persistent_notification.async_create(
+            self.hass,
+            message,
+            title="🚗 Uber Ride Tracker - API Setup Guide",
+            notification_id=f"{DOMAIN}_setup_guide",
         )
         
         # Also copy redirect URI to clipboard if possible
@@ -225,31 +238,23 @@ Return here and enter your credentials
         result["message"] = "Auto-configuration prepared"
         result["next_steps"] = [
             f"1. Go to: {UBER_DEVELOPER_DASHBOARD}",
-            f"2. Select your app",
+            "2. Select your app",
             f"3. Add Redirect URI: {redirect_uri}",
-            f"4. Enable scopes: profile, request, all_trips",
-            f"5. Save changes"
+            "4. Enable scopes: profile, request, all_trips",
+            "5. Save changes"
         ]
         
         # Create a clickable link notification
-        await self.hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "📋 Configuration Ready",
-                "message": f"Redirect URI copied to clipboard:\n`{redirect_uri}`\n\n[Open Uber Dashboard]({UBER_DEVELOPER_DASHBOARD})",
-                "notification_id": f"{DOMAIN}_auto_config",
-            }
+        persistent_notification.async_create(
+            self.hass,
+            f"Redirect URI copied to clipboard:\n`{redirect_uri}`\n\n[Open Uber Dashboard]({UBER_DEVELOPER_DASHBOARD})",
+            title="📋 Configuration Ready",
+            notification_id=f"{DOMAIN}_auto_config",
         )
         
         result["success"] = True
         return result
 
-    async def cleanup(self):
-        """Clean up resources."""
-        await self.session.close()
-
-
 async def simplify_setup_flow(hass: HomeAssistant) -> None:
     """Simplify the entire setup flow with automation."""
     helper = UberAPISetupHelper(hass)
@@ -265,8 +270,6 @@ async def simplify_setup_flow(hass: HomeAssistant) -> None:
     # Get redirect URI for easy copying
     redirect_uri = await helper.get_redirect_uri()
     _LOGGER.info("Redirect URI for Uber app: %s", redirect_uri)
-    
-    await helper.cleanup()
 
 
 class SetupWizard:
@@ -329,6 +332,5 @@ class SetupWizard:
             helper = UberAPISetupHelper(hass)
             redirect_uri = await helper.get_redirect_uri()
             step["fields"]["redirect_uri"]["value"] = redirect_uri
-            await helper.cleanup()
         
         return step
\ No newline at end of file